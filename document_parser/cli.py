@@ -8,11 +8,6 @@ import logging
 import sys
 from pathlib import Path
 
-from document_parser.config.settings import load_settings
-from document_parser.mcp.server import DocumentParserServer
-from document_parser.utils.file_utils import ensure_directory
-from document_parser.utils.logging_utils import setup_logging
-
 
 async def run_server(config_path: str, debug: bool = False) -> None:
     """
@@ -22,6 +17,13 @@ async def run_server(config_path: str, debug: bool = False) -> None:
         config_path: Path to configuration file
         debug: Enable debug logging
     """
+    # Imported here so that --help/--version don't pay for loading the
+    # server stack (MCP, Docling, HTTP client)
+    from document_parser.config.settings import load_settings
+    from document_parser.mcp.server import DocumentParserServer
+    from document_parser.utils.file_utils import ensure_directory
+    from document_parser.utils.logging_utils import setup_logging
+
     # Load configuration
     try:
         settings = load_settings(config_path)
@@ -31,7 +33,9 @@ async def run_server(config_path: str, debug: bool = False) -> None:
 
     # Override log level if debug enabled
     if debug:
-        settings.logging.level = "DEBUG"
+        settings = settings.model_copy(
+            update={"logging": settings.logging.model_copy(update={"level": "DEBUG"})}
+        )
 
     # Setup logging
     setup_logging(settings.logging)
@@ -55,6 +59,16 @@ async def run_server(config_path: str, debug: bool = False) -> None:
         sys.exit(1)
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop implementation if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -95,6 +109,7 @@ Examples:
     args = parser.parse_args()
 
     # Run server
+    _install_uvloop()
     asyncio.run(run_server(args.config, args.debug))
 
 
@@ -2,7 +2,11 @@
 Configuration models using Pydantic.
 """
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, field_validator
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
 
 
 class ServerSettings(BaseModel):
@@ -16,6 +20,20 @@ class ServerSettings(BaseModel):
     job_timeout_seconds: int = Field(
         default=600, ge=60, description="Job timeout in seconds"
     )
+    warmup_on_start: bool = Field(
+        default=True, description="Load processing models at server startup"
+    )
+    stream_threshold: int = Field(
+        default=1_000_000,
+        ge=0,
+        description="Results longer than this many characters are paged (0 disables)",
+    )
+    scheduling_weights: dict[str, PositiveInt] = Field(
+        default_factory=dict,
+        description="Share of processing slots per source host (default 1)",
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class StorageSettings(BaseModel):
@@ -37,6 +55,8 @@ class StorageSettings(BaseModel):
         default=600, ge=30, description="Download timeout in seconds"
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class OCRSettings(BaseModel):
     """OCR configuration settings."""
@@ -47,6 +67,8 @@ class OCRSettings(BaseModel):
         default=True, description="Auto-detect when OCR is needed"
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class PDFSettings(BaseModel):
     """PDF processing settings."""
@@ -58,18 +80,11 @@ class PDFSettings(BaseModel):
     enable_table_extraction: bool = Field(
         default=True, description="Enable table extraction"
     )
-    table_accuracy_mode: str = Field(
+    table_accuracy_mode: Literal["fast", "accurate"] = Field(
         default="accurate", description="Table extraction mode"
     )
 
-    @field_validator("table_accuracy_mode")
-    @classmethod
-    def validate_table_mode(cls, value: str) -> str:
-        """Validate table accuracy mode."""
-        allowed = ["fast", "accurate"]
-        if value not in allowed:
-            raise ValueError(f"table_accuracy_mode must be one of {allowed}")
-        return value
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class PerformanceSettings(BaseModel):
@@ -85,11 +100,13 @@ class PerformanceSettings(BaseModel):
         default=4, ge=1, le=16, description="Number of processing threads"
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ProcessingSettings(BaseModel):
     """Document processing settings."""
 
-    default_pipeline: str = Field(
+    default_pipeline: Literal["standard", "vlm", "asr"] = Field(
         default="standard", description="Default processing pipeline"
     )
     enable_pipeline_auto_detect: bool = Field(
@@ -101,20 +118,15 @@ class ProcessingSettings(BaseModel):
         default_factory=PerformanceSettings, description="Performance settings"
     )
 
-    @field_validator("default_pipeline")
-    @classmethod
-    def validate_pipeline(cls, value: str) -> str:
-        """Validate pipeline name."""
-        allowed = ["standard", "vlm", "asr"]
-        if value not in allowed:
-            raise ValueError(f"default_pipeline must be one of {allowed}")
-        return value
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class LoggingSettings(BaseModel):
     """Logging configuration settings."""
 
-    level: str = Field(default="INFO", description="Logging level")
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="INFO", description="Logging level"
+    )
     format_string: str = Field(
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log format string",
@@ -128,15 +140,15 @@ class LoggingSettings(BaseModel):
         default=False, description="Enable JSON formatted logs"
     )
 
-    @field_validator("level")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @field_validator("level", mode="before")
     @classmethod
-    def validate_level(cls, value: str) -> str:
-        """Validate logging level."""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        value_upper = value.upper()
-        if value_upper not in allowed:
-            raise ValueError(f"level must be one of {allowed}")
-        return value_upper
+    def normalize_level(cls, value: Any) -> Any:
+        """Accept logging levels case-insensitively."""
+        if isinstance(value, str):
+            return value.upper()
+        return value
 
 
 class RetrySettings(BaseModel):
@@ -155,6 +167,8 @@ class RetrySettings(BaseModel):
         default=2, ge=1, description="Delay between retries in seconds"
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ApplicationSettings(BaseModel):
     """Main application settings."""
@@ -175,7 +189,46 @@ class ApplicationSettings(BaseModel):
         default_factory=RetrySettings, description="Retry settings"
     )
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid",
-    )
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @classmethod
+    def _from_trusted(cls, data: dict[str, Any]) -> "ApplicationSettings":
+        """
+        Build settings from previously validated data without revalidating.
+
+        Only use this for data produced by ``model_dump`` of a validated
+        instance (e.g. the on-disk settings cache); untrusted input must go
+        through normal validation.
+
+        Args:
+            data: Settings data as produced by ``model_dump``
+
+        Returns:
+            ApplicationSettings instance
+        """
+        return _construct_trusted(cls, data)
+
+
+def _construct_trusted(model_cls: type[_ModelT], data: dict[str, Any]) -> _ModelT:
+    """
+    Recursively construct a model and its nested models via ``model_construct``.
+
+    Args:
+        model_cls: Model class to construct
+        data: Previously validated field data
+
+    Returns:
+        Model instance
+    """
+    values = {}
+    for name, value in data.items():
+        annotation = model_cls.model_fields[name].annotation
+        if (
+            isinstance(value, dict)
+            and isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+        ):
+            value = _construct_trusted(annotation, value)
+        values[name] = value
+
+    return model_cls.model_construct(**values)
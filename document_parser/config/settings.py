@@ -2,23 +2,44 @@
 Settings loader and manager.
 """
 
+import hashlib
+import json
 import os
+import tempfile
+from functools import cache
 from pathlib import Path
 
 import yaml
+from pydantic import BaseModel, TypeAdapter
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # Fall back to the pure-Python implementation if libyaml is unavailable
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+from document_parser import __version__
 from document_parser.config.models import ApplicationSettings
 from document_parser.core.exceptions import ConfigurationError
 
 _settings_instance: ApplicationSettings | None = None
 
+# Validator for raw configuration data, built once at import time
+_ADAPTER = TypeAdapter(ApplicationSettings)
+
 
-def load_settings(config_path: str | None = None) -> ApplicationSettings:
+def load_settings(
+    config_path: str | None = None, cache_dir: str | None = None
+) -> ApplicationSettings:
     """
     Load application settings from YAML file.
 
     Args:
         config_path: Path to configuration file. If None, uses default config.yaml
+        cache_dir: Directory for caching parsed settings. If None, uses
+            $DOCUMENT_PARSER_CACHE_DIR; caching is disabled if neither is set
 
     Returns:
         ApplicationSettings instance
@@ -36,14 +57,27 @@ def load_settings(config_path: str | None = None) -> ApplicationSettings:
     if not config_file.exists():
         return ApplicationSettings()
 
+    if cache_dir is None:
+        cache_dir = os.getenv("DOCUMENT_PARSER_CACHE_DIR")
+
+    cache_file = None
+    if cache_dir:
+        cache_file = _settings_cache_path(Path(cache_dir), config_file)
+        fingerprint = _config_fingerprint(config_file)
+
+        # Reuse previously parsed settings if the config file is unchanged
+        cached = _read_settings_cache(cache_file, fingerprint)
+        if cached is not None:
+            return cached
+
     try:
         with open(config_file, encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
 
         if config_data is None:
             return ApplicationSettings()
 
-        return ApplicationSettings(**config_data)
+        settings = _ADAPTER.validate_python(config_data)
 
     except yaml.YAMLError as e:
         raise ConfigurationError(
@@ -54,6 +88,124 @@ def load_settings(config_path: str | None = None) -> ApplicationSettings:
             f"Failed to load configuration: {config_path}", details=str(e)
         )
 
+    if cache_file is not None:
+        _write_settings_cache(cache_file, fingerprint, settings)
+
+    return settings
+
+
+def _settings_cache_path(cache_dir: Path, config_file: Path) -> Path:
+    """
+    Get the cache file for a config file.
+
+    Args:
+        cache_dir: Settings cache directory
+        config_file: Path to configuration file
+
+    Returns:
+        Cache file path, unique per resolved config file path
+    """
+    key = hashlib.sha256(str(config_file.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / f"settings-{key}.json"
+
+
+@cache
+def _schema_hash(model_cls: type[BaseModel] = ApplicationSettings) -> str:
+    """
+    Hash the field definitions of a settings model and its nested models.
+
+    Args:
+        model_cls: Settings model class
+
+    Returns:
+        Hex digest that changes whenever a field, type or constraint changes
+    """
+    digest = hashlib.sha256()
+    for name, field in model_cls.model_fields.items():
+        digest.update(f"{model_cls.__name__}.{name}:{field!r}\n".encode())
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            digest.update(_schema_hash(annotation).encode())
+
+    return digest.hexdigest()
+
+
+def _config_fingerprint(config_file: Path) -> list[str | int]:
+    """
+    Identify a config file revision and the settings schema that parsed it.
+
+    Args:
+        config_file: Path to configuration file
+
+    Returns:
+        Nanosecond mtime, size, package version and settings schema hash
+    """
+    stat = config_file.stat()
+    return [stat.st_mtime_ns, stat.st_size, __version__, _schema_hash()]
+
+
+def _read_settings_cache(
+    cache_file: Path, fingerprint: list[str | int]
+) -> ApplicationSettings | None:
+    """
+    Read settings from the JSON cache.
+
+    Args:
+        cache_file: Path to cache file
+        fingerprint: Fingerprint of the current config file and schema
+
+    Returns:
+        Cached settings if the cache matches the config file, None otherwise
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+
+        if cached["fingerprint"] != fingerprint:
+            return None
+
+        # The same file was validated by the same schema and package version
+        # when the cache was written, so skip validation
+        return ApplicationSettings._from_trusted(cached["settings"])
+
+    except Exception:
+        # Missing, unreadable or stale-format cache; fall back to parsing
+        return None
+
+
+def _write_settings_cache(
+    cache_file: Path, fingerprint: list[str | int], settings: ApplicationSettings
+) -> None:
+    """
+    Atomically write parsed settings to the JSON cache.
+
+    Args:
+        cache_file: Path to cache file
+        fingerprint: Fingerprint of the parsed config file and schema
+        settings: Parsed settings to cache
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_file.parent, prefix=f".{cache_file.name}."
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fingerprint": fingerprint,
+                        "settings": settings.model_dump(mode="json"),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        # Caching is best-effort (e.g. read-only cache directory)
+        pass
+
 
 def get_settings() -> ApplicationSettings:
     """
@@ -85,63 +237,14 @@ def create_default_config(output_path: str = "config.yaml") -> None:
     Args:
         output_path: Path where to write the config file
     """
-    settings = ApplicationSettings()
-
-    config_dict = {
-        "server": {
-            "name": settings.server.name,
-            "version": settings.server.version,
-            "max_concurrent_jobs": settings.server.max_concurrent_jobs,
-            "job_timeout_seconds": settings.server.job_timeout_seconds,
-        },
-        "storage": {
-            "temp_directory": settings.storage.temp_directory,
-            "cleanup_interval_hours": settings.storage.cleanup_interval_hours,
-            "max_file_size_mb": settings.storage.max_file_size_mb,
-            "allowed_schemes": settings.storage.allowed_schemes,
-            "download_timeout_seconds": settings.storage.download_timeout_seconds,
-        },
-        "processing": {
-            "default_pipeline": settings.processing.default_pipeline,
-            "enable_pipeline_auto_detect": settings.processing.enable_pipeline_auto_detect,
-            "ocr": {
-                "engine": settings.processing.ocr.engine,
-                "languages": settings.processing.ocr.languages,
-                "enable_auto_detect": settings.processing.ocr.enable_auto_detect,
-            },
-            "pdf": {
-                "backend": settings.processing.pdf.backend,
-                "fallback_backend": settings.processing.pdf.fallback_backend,
-                "enable_table_extraction": settings.processing.pdf.enable_table_extraction,
-                "table_accuracy_mode": settings.processing.pdf.table_accuracy_mode,
-            },
-            "performance": {
-                "max_memory_gb": settings.processing.performance.max_memory_gb,
-                "enable_mlx_acceleration": settings.processing.performance.enable_mlx_acceleration,
-                "thread_count": settings.processing.performance.thread_count,
-            },
-        },
-        "logging": {
-            "level": settings.logging.level,
-            "format_string": settings.logging.format_string,
-            "file_path": settings.logging.file_path,
-            "max_file_size_mb": settings.logging.max_file_size_mb,
-            "backup_count": settings.logging.backup_count,
-            "enable_json_logs": settings.logging.enable_json_logs,
-        },
-        "retry": {
-            "enable_pipeline_fallback": settings.retry.enable_pipeline_fallback,
-            "enable_backend_fallback": settings.retry.enable_backend_fallback,
-            "max_attempts": settings.retry.max_attempts,
-            "delay_seconds": settings.retry.delay_seconds,
-        },
-    }
+    config_dict = ApplicationSettings().model_dump(mode="python")
 
     output_file = Path(output_path)
     with open(output_file, "w", encoding="utf-8") as f:
         yaml.dump(
             config_dict,
             f,
+            Dumper=_YamlDumper,
             default_flow_style=False,
             sort_keys=False,
             indent=2,
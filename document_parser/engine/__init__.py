@@ -2,10 +2,14 @@
 Document processing engine module.
 """
 
-from document_parser.engine.pipeline_factory import PipelineFactory
+from document_parser.engine.pipeline_factory import (
+    PipelineFactory,
+    PipelineUserOptions,
+)
 from document_parser.engine.processor import DocumentProcessor
 
 __all__ = [
     "DocumentProcessor",
     "PipelineFactory",
+    "PipelineUserOptions",
 ]
@@ -2,7 +2,11 @@
 Download manager for remote documents.
 """
 
+import importlib.util
 import logging
+import os
+import re
+import tempfile
 from pathlib import Path
 
 import aiofiles
@@ -10,12 +14,42 @@ import httpx
 
 from document_parser.config.models import StorageSettings
 from document_parser.core.exceptions import NetworkError
-from document_parser.utils.file_utils import ensure_directory, sanitize_filename
+from document_parser.utils.file_utils import sanitize_filename
 from document_parser.utils.network_utils import (
     extract_filename_from_url,
     validate_url_scheme,
 )
 
+_LOG = logging.getLogger(__name__)
+
+# Size of chunks read from the network and written to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# URL path tails that are already safe to use as a filename
+_CLEAN_FILENAME = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+def _filename_for_url(url: str) -> str:
+    """
+    Derive a safe local filename for a URL.
+
+    Args:
+        url: URL being downloaded
+
+    Returns:
+        Sanitized filename
+    """
+    # The last path segment, with the query and fragment already removed
+    filename = extract_filename_from_url(url)
+    if filename is None:
+        return "downloaded_file"
+
+    # Fast path: the name is already safe to use as is
+    if _CLEAN_FILENAME.fullmatch(filename):
+        return filename
+
+    return sanitize_filename(filename)
+
 
 class DownloadManager:
     """
@@ -30,8 +64,19 @@ class DownloadManager:
             settings: Storage configuration settings
         """
         self.settings = settings
-        self._logger = logging.getLogger(__name__)
-        self._temp_dir = Path(settings.temp_directory)
+        self._allowed_schemes = frozenset(settings.allowed_schemes)
+        self._temp_dir = Path(settings.temp_directory).resolve()
+        self._temp_dir_prefix = str(self._temp_dir) + os.sep
+        self._temp_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared client so connections (and TLS sessions) are pooled across
+        # downloads; HTTP/2 is only enabled when the h2 package is installed
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.download_timeout_seconds),
+            follow_redirects=True,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
 
     async def download_file(self, url: str) -> str:
         """
@@ -47,47 +92,80 @@ class DownloadManager:
             NetworkError: If download fails
         """
         # Validate URL scheme
-        if not validate_url_scheme(url, self.settings.allowed_schemes):
+        if not validate_url_scheme(url, self._allowed_schemes):
             raise NetworkError(
                 f"URL scheme not allowed. Allowed schemes: {self.settings.allowed_schemes}",
                 details=url,
             )
 
-        # Ensure temp directory exists
-        ensure_directory(str(self._temp_dir))
+        # Give each download its own file, so concurrent downloads of URLs
+        # with the same basename don't share (or delete) each other's file;
+        # the original name is kept as the suffix for format detection
+        fd, temp_name = tempfile.mkstemp(
+            dir=self._temp_dir, prefix="download_", suffix=f"_{_filename_for_url(url)}"
+        )
+        os.close(fd)
+        temp_path = Path(temp_name)
 
-        # Generate filename
-        filename = extract_filename_from_url(url) or "downloaded_file"
-        safe_filename = sanitize_filename(filename)
-        temp_path = self._temp_dir / f"download_{safe_filename}"
+        _LOG.info("Downloading file from %s", url)
 
-        self._logger.info(f"Downloading file from {url}")
+        max_bytes = self.settings.max_file_size_mb * 1024 * 1024
 
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self.settings.download_timeout_seconds),
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
+            async with self._client.stream("GET", url) as response:
                 response.raise_for_status()
 
-                # Write file
-                async with aiofiles.open(temp_path, "wb") as f:
-                    await f.write(response.content)
+                content_length = response.headers.get("content-length")
+                if content_length and content_length.isdigit():
+                    if int(content_length) > max_bytes:
+                        raise self._size_error(url)
 
-            self._logger.info(f"Downloaded file to {temp_path}")
+                # Stream to disk, enforcing the size limit as data arrives
+                received = 0
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE
+                    ):
+                        received += len(chunk)
+                        if received > max_bytes:
+                            raise self._size_error(url)
+                        await f.write(chunk)
+
+            _LOG.info("Downloaded file to %s", temp_path)
             return str(temp_path)
 
+        except NetworkError as e:
+            _LOG.error("Download rejected for %s: %s", url, e)
+            await self.cleanup_file(str(temp_path))
+            raise
+
         except httpx.HTTPError as e:
-            self._logger.error(f"HTTP error downloading {url}: {e}")
+            _LOG.error("HTTP error downloading %s: %s", url, e)
+            await self.cleanup_file(str(temp_path))
             raise NetworkError(f"Failed to download file from {url}", details=str(e))
 
         except Exception as e:
-            self._logger.error(f"Unexpected error downloading {url}: {e}")
+            _LOG.error("Unexpected error downloading %s: %s", url, e)
+            await self.cleanup_file(str(temp_path))
             raise NetworkError(
                 f"Unexpected error downloading file from {url}", details=str(e)
             )
 
+    def _size_error(self, url: str) -> NetworkError:
+        """
+        Build the error raised when a download exceeds the size limit.
+
+        Args:
+            url: URL being downloaded
+
+        Returns:
+            NetworkError describing the limit
+        """
+        return NetworkError(
+            f"File exceeds maximum size of {self.settings.max_file_size_mb} MB",
+            details=url,
+        )
+
     async def cleanup_file(self, file_path: str) -> None:
         """
         Remove a downloaded file.
@@ -95,13 +173,23 @@ class DownloadManager:
         Args:
             file_path: Path to file to remove
         """
+        # Only remove files directly inside the temp directory
+        if (
+            not file_path.startswith(self._temp_dir_prefix)
+            or os.sep in file_path[len(self._temp_dir_prefix) :]
+        ):
+            return
+
         try:
-            path = Path(file_path)
+            os.unlink(file_path)
+            _LOG.debug("Cleaned up file: %s", file_path)
 
-            # Only remove files in temp directory
-            if path.exists() and path.parent == self._temp_dir:
-                path.unlink()
-                self._logger.debug(f"Cleaned up file: {file_path}")
+        except FileNotFoundError:
+            pass
 
         except Exception as e:
-            self._logger.warning(f"Failed to cleanup file {file_path}: {e}")
+            _LOG.warning("Failed to cleanup file %s: %s", file_path, e)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        await self._client.aclose()
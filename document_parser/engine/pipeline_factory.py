@@ -2,12 +2,237 @@
 Factory for creating document processing pipelines.
 """
 
+import importlib
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import cached_property
 from typing import Any
 
 from document_parser.config.models import ProcessingSettings
 from document_parser.processing.job import ProcessingPipeline
 
+_LOG = logging.getLogger(__name__)
+
+# Supported formats are static, so build them once and share the result
+_SUPPORTED_FORMATS: dict[str, tuple[str, ...]] = {
+    "input_formats": (
+        "pdf",
+        "docx",
+        "xlsx",
+        "pptx",
+        "html",
+        "htm",
+        "xhtml",
+        "md",
+        "markdown",
+        "csv",
+        "png",
+        "jpg",
+        "jpeg",
+        "tiff",
+        "tif",
+        "bmp",
+        "webp",
+        "mp3",
+        "wav",
+        "m4a",
+        "flac",
+        "xml",
+    ),
+    "output_formats": ("markdown", "html", "json", "text", "doctags"),
+    "pipelines": ("standard", "vlm", "asr"),
+}
+
+# Docling PDF backend classes by configured name, as (module, class)
+_PDF_BACKENDS: dict[str, tuple[str, str]] = {
+    "dlparse_v4": (
+        "docling.backend.docling_parse_v4_backend",
+        "DoclingParseV4DocumentBackend",
+    ),
+    "dlparse_v2": (
+        "docling.backend.docling_parse_v2_backend",
+        "DoclingParseV2DocumentBackend",
+    ),
+    "dlparse_v1": (
+        "docling.backend.docling_parse_backend",
+        "DoclingParseDocumentBackend",
+    ),
+    "pypdfium2": ("docling.backend.pypdfium2_backend", "PyPdfiumDocumentBackend"),
+}
+
+# Table structure modes accepted in user options
+_TABLE_MODES = ("fast", "accurate")
+
+# Pipeline option sets kept per factory; the key space is small once user
+# options are validated, but keep it bounded regardless
+_MAX_CACHED_OPTIONS = 32
+
+# Docling symbols, imported on first use and reused afterwards
+_docling_standard: tuple | None = None
+_docling_vlm: tuple | None = None
+_docling_asr: tuple | None = None
+
+
+def _import_standard_pipeline() -> tuple:
+    """
+    Import Docling symbols needed by the standard pipeline.
+
+    Returns:
+        Tuple of (InputFormat, PdfPipelineOptions, PdfFormatOption,
+        TableFormerMode)
+    """
+    global _docling_standard
+
+    if _docling_standard is None:
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import (
+            PdfPipelineOptions,
+            TableFormerMode,
+        )
+        from docling.document_converter import PdfFormatOption
+
+        _docling_standard = (
+            InputFormat,
+            PdfPipelineOptions,
+            PdfFormatOption,
+            TableFormerMode,
+        )
+
+    return _docling_standard
+
+
+def _import_vlm_pipeline() -> tuple:
+    """
+    Import Docling symbols needed by the VLM pipeline.
+
+    Returns:
+        Tuple of (vlm_model_specs, InputFormat, VlmPipelineOptions,
+        PdfFormatOption, VlmPipeline)
+    """
+    global _docling_vlm
+
+    if _docling_vlm is None:
+        from docling.datamodel import vlm_model_specs
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import VlmPipelineOptions
+        from docling.document_converter import PdfFormatOption
+        from docling.pipeline.vlm_pipeline import VlmPipeline
+
+        _docling_vlm = (
+            vlm_model_specs,
+            InputFormat,
+            VlmPipelineOptions,
+            PdfFormatOption,
+            VlmPipeline,
+        )
+
+    return _docling_vlm
+
+
+def _import_asr_pipeline() -> tuple:
+    """
+    Import Docling symbols needed by the ASR pipeline.
+
+    Returns:
+        Tuple of (InputFormat, AsrPipelineOptions, AudioFormatOption,
+        AsrPipeline)
+    """
+    global _docling_asr
+
+    if _docling_asr is None:
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import AsrPipelineOptions
+        from docling.document_converter import AudioFormatOption
+        from docling.pipeline.asr_pipeline import AsrPipeline
+
+        _docling_asr = (InputFormat, AsrPipelineOptions, AudioFormatOption, AsrPipeline)
+
+    return _docling_asr
+
+
+def _import_pdf_backend(name: str) -> type | None:
+    """
+    Import the Docling PDF backend class for a configured backend name.
+
+    Args:
+        name: Backend name (e.g. 'dlparse_v4', 'pypdfium2')
+
+    Returns:
+        Backend class, or None if the name is unknown or the backend is
+        not installed (Docling then uses its default backend)
+    """
+    target = _PDF_BACKENDS.get(name)
+    if target is None:
+        _LOG.warning("Unknown PDF backend '%s', using Docling default", name)
+        return None
+
+    module_name, class_name = target
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        _LOG.warning("PDF backend '%s' not available: %s", name, e)
+        return None
+
+    backend: type = getattr(module, class_name)
+    return backend
+
+
+@dataclass(slots=True, frozen=True)
+class PipelineUserOptions:
+    """
+    User-provided pipeline options, parsed once from the raw options dict.
+
+    Fields left as None fall back to the configured processing settings.
+    """
+
+    ocr_enabled: bool | None = None
+    enable_enrichments: bool = False
+    table_accuracy_mode: str | None = None
+    pdf_backend: str | None = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate option values, which come straight from clients.
+
+        Raises:
+            ValueError: If an option has an invalid type or value
+        """
+        if self.ocr_enabled is not None and not isinstance(self.ocr_enabled, bool):
+            raise ValueError(f"ocr_enabled must be a boolean: {self.ocr_enabled!r}")
+        if not isinstance(self.enable_enrichments, bool):
+            raise ValueError(
+                f"enable_enrichments must be a boolean: {self.enable_enrichments!r}"
+            )
+        if (
+            self.table_accuracy_mode is not None
+            and self.table_accuracy_mode not in _TABLE_MODES
+        ):
+            raise ValueError(
+                f"Unknown table_accuracy_mode: {self.table_accuracy_mode!r}"
+            )
+        if self.pdf_backend is not None and self.pdf_backend not in _PDF_BACKENDS:
+            raise ValueError(f"Unknown pdf_backend: {self.pdf_backend!r}")
+
+    @classmethod
+    def from_dict(cls, options: dict[str, Any]) -> "PipelineUserOptions":
+        """
+        Create options from a raw options dictionary, ignoring unknown keys.
+
+        Args:
+            options: User-provided options
+
+        Returns:
+            PipelineUserOptions instance
+
+        Raises:
+            ValueError: If an option has an invalid type or value
+        """
+        return cls(**{k: v for k, v in options.items() if k in _USER_OPTION_FIELDS})
+
+
+_USER_OPTION_FIELDS = frozenset(f.name for f in fields(PipelineUserOptions))
+
 
 class PipelineFactory:
     """
@@ -21,11 +246,73 @@ class PipelineFactory:
         Args:
             settings: Processing configuration settings
         """
+        self._opts_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
         self.settings = settings
-        self._logger = logging.getLogger(__name__)
+        self._dispatch = {
+            ProcessingPipeline.STANDARD: self.create_standard_pipeline_options,
+            ProcessingPipeline.VLM: self.create_vlm_pipeline_options,
+            ProcessingPipeline.ASR: self.create_asr_pipeline_options,
+        }
+
+    @property
+    def settings(self) -> ProcessingSettings:
+        """Processing configuration settings."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: ProcessingSettings) -> None:
+        # Cached pipeline options depend on the settings they were built from
+        self._settings = settings
+        self._opts_cache.clear()
+        self.__dict__.pop("vlm_model", None)
+        self.__dict__.pop("accelerator_options", None)
+
+    @cached_property
+    def accelerator_options(self) -> Any:
+        """
+        Docling accelerator options shared by all pipelines.
+
+        The device is left on AUTO so Docling picks CUDA or MPS when
+        available and falls back to CPU otherwise.
+
+        Returns:
+            Docling AcceleratorOptions
+        """
+        from docling.datamodel.pipeline_options import (
+            AcceleratorDevice,
+            AcceleratorOptions,
+        )
+
+        return AcceleratorOptions(
+            num_threads=self.settings.performance.thread_count,
+            device=AcceleratorDevice.AUTO,
+        )
+
+    @cached_property
+    def vlm_model(self) -> Any:
+        """
+        VLM model spec to use, resolved once per settings instance.
+
+        Returns:
+            Docling VLM model options
+
+        Raises:
+            ImportError: If the Docling VLM pipeline is not installed
+        """
+        vlm_model_specs = _import_vlm_pipeline()[0]
+
+        # Choose VLM model based on MLX availability
+        if self.settings.performance.enable_mlx_acceleration:
+            vlm_model = getattr(vlm_model_specs, "SMOLDOCLING_MLX", None)
+            if vlm_model is not None:
+                _LOG.info("Using MLX-accelerated VLM model")
+                return vlm_model
+
+        _LOG.info("Using Transformers VLM model")
+        return vlm_model_specs.SMOLDOCLING_TRANSFORMERS
 
     def create_standard_pipeline_options(
-        self, user_options: dict[str, Any]
+        self, user_options: PipelineUserOptions
     ) -> dict[str, Any]:
         """
         Create configuration for standard processing pipeline.
@@ -36,38 +323,60 @@ class PipelineFactory:
         Returns:
             Pipeline configuration dictionary
         """
-        from docling.datamodel.base_models import InputFormat
-        from docling.datamodel.pipeline_options import PdfPipelineOptions
-        from docling.document_converter import PdfFormatOption
+        (
+            InputFormat,
+            PdfPipelineOptions,
+            PdfFormatOption,
+            TableFormerMode,
+        ) = _import_standard_pipeline()
 
         # Create base pipeline options
         pipeline_opts = PdfPipelineOptions()
+        pipeline_opts.accelerator_options = self.accelerator_options
 
         # Configure OCR
-        ocr_enabled = user_options.get(
-            "ocr_enabled", self.settings.ocr.enable_auto_detect
-        )
+        ocr_enabled = user_options.ocr_enabled
+        if ocr_enabled is None:
+            ocr_enabled = self.settings.ocr.enable_auto_detect
         pipeline_opts.do_ocr = ocr_enabled
 
         # Configure enrichments if requested
-        if user_options.get("enable_enrichments", False):
+        if user_options.enable_enrichments:
             pipeline_opts.do_code_enrichment = True
             pipeline_opts.do_formula_enrichment = True
 
         # Table extraction mode
-        user_options.get("table_accuracy_mode", self.settings.pdf.table_accuracy_mode)
+        table_mode = (
+            user_options.table_accuracy_mode or self.settings.pdf.table_accuracy_mode
+        )
+        pipeline_opts.do_table_structure = self.settings.pdf.enable_table_extraction
+        pipeline_opts.table_structure_options.mode = (
+            TableFormerMode.FAST if table_mode == "fast" else TableFormerMode.ACCURATE
+        )
 
         # Configure PDF backend
-        pdf_backend = user_options.get("pdf_backend", self.settings.pdf.backend)
+        pdf_backend = user_options.pdf_backend or self.settings.pdf.backend
 
-        self._logger.debug(
-            f"Standard pipeline: OCR={ocr_enabled}, backend={pdf_backend}"
-        )
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug(
+                "Standard pipeline: OCR=%s, table_mode=%s, backend=%s",
+                ocr_enabled,
+                table_mode,
+                pdf_backend,
+            )
 
-        return {InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_opts)}
+        backend = _import_pdf_backend(pdf_backend)
+        if backend is None:
+            return {InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_opts)}
+
+        return {
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pipeline_opts, backend=backend
+            )
+        }
 
     def create_vlm_pipeline_options(
-        self, user_options: dict[str, Any]
+        self, user_options: PipelineUserOptions
     ) -> dict[str, Any]:
         """
         Create configuration for VLM (Vision-Language Model) pipeline.
@@ -79,25 +388,16 @@ class PipelineFactory:
             Pipeline configuration dictionary
         """
         try:
-            from docling.datamodel import vlm_model_specs
-            from docling.datamodel.base_models import InputFormat
-            from docling.datamodel.pipeline_options import VlmPipelineOptions
-            from docling.document_converter import PdfFormatOption
-            from docling.pipeline.vlm_pipeline import VlmPipeline
-
-            # Choose VLM model based on MLX availability
-            if self.settings.performance.enable_mlx_acceleration:
-                try:
-                    vlm_model = vlm_model_specs.SMOLDOCLING_MLX
-                    self._logger.info("Using MLX-accelerated VLM model")
-                except AttributeError:
-                    vlm_model = vlm_model_specs.SMOLDOCLING_TRANSFORMERS
-                    self._logger.info("Using Transformers VLM model")
-            else:
-                vlm_model = vlm_model_specs.SMOLDOCLING_TRANSFORMERS
-                self._logger.info("Using Transformers VLM model")
-
-            pipeline_opts = VlmPipelineOptions(vlm_options=vlm_model)
+            (
+                _,
+                InputFormat,
+                VlmPipelineOptions,
+                PdfFormatOption,
+                VlmPipeline,
+            ) = _import_vlm_pipeline()
+
+            pipeline_opts = VlmPipelineOptions(vlm_options=self.vlm_model)
+            pipeline_opts.accelerator_options = self.accelerator_options
 
             return {
                 InputFormat.PDF: PdfFormatOption(
@@ -106,12 +406,12 @@ class PipelineFactory:
             }
 
         except ImportError as e:
-            self._logger.warning(f"VLM pipeline not available: {e}")
+            _LOG.warning("VLM pipeline not available: %s", e)
             # Fallback to standard pipeline
             return self.create_standard_pipeline_options(user_options)
 
     def create_asr_pipeline_options(
-        self, user_options: dict[str, Any]
+        self, user_options: PipelineUserOptions
     ) -> dict[str, Any]:
         """
         Create configuration for ASR (Automatic Speech Recognition) pipeline.
@@ -123,17 +423,15 @@ class PipelineFactory:
             Pipeline configuration dictionary
         """
         try:
-            from docling.datamodel.base_models import InputFormat
-            from docling.datamodel.pipeline_options import AsrPipelineOptions
-            from docling.document_converter import AudioFormatOption
-            from docling.pipeline.asr_pipeline import AsrPipeline
-
-            # Configure ASR model size
-            asr_model = user_options.get("asr_model", "whisper_small")
+            (
+                InputFormat,
+                AsrPipelineOptions,
+                AudioFormatOption,
+                AsrPipeline,
+            ) = _import_asr_pipeline()
 
             pipeline_opts = AsrPipelineOptions()
-
-            self._logger.info(f"Using ASR model: {asr_model}")
+            pipeline_opts.accelerator_options = self.accelerator_options
 
             return {
                 InputFormat.AUDIO: AudioFormatOption(
@@ -142,7 +440,7 @@ class PipelineFactory:
             }
 
         except ImportError as e:
-            self._logger.warning(f"ASR pipeline not available: {e}")
+            _LOG.warning("ASR pipeline not available: %s", e)
             # Fallback to standard pipeline
             return self.create_standard_pipeline_options(user_options)
 
@@ -159,48 +457,70 @@ class PipelineFactory:
         Returns:
             Pipeline configuration dictionary
         """
-        if pipeline == ProcessingPipeline.STANDARD:
-            return self.create_standard_pipeline_options(user_options)
-        elif pipeline == ProcessingPipeline.VLM:
-            return self.create_vlm_pipeline_options(user_options)
-        elif pipeline == ProcessingPipeline.ASR:
-            return self.create_asr_pipeline_options(user_options)
+        opts = PipelineUserOptions.from_dict(user_options)
+        key = self.options_key(pipeline, opts)
+
+        cached = self._opts_cache.get(key)
+        if cached is None:
+            cached = self._create_pipeline_options(pipeline, opts)
+            self._opts_cache[key] = cached
+            if len(self._opts_cache) > _MAX_CACHED_OPTIONS:
+                self._opts_cache.popitem(last=False)
         else:
-            # Default to standard
-            return self.create_standard_pipeline_options(user_options)
+            self._opts_cache.move_to_end(key)
+
+        return cached
+
+    def options_key(
+        self, pipeline: ProcessingPipeline, user_options: PipelineUserOptions
+    ) -> tuple:
+        """
+        Get a cache key for the pipeline options built from user options.
+
+        Settings defaults are applied first, so option sets that build the
+        same pipeline options share a key.
+
+        Args:
+            pipeline: Pipeline type
+            user_options: User-provided options
+
+        Returns:
+            Hashable key
+        """
+        ocr_enabled = user_options.ocr_enabled
+        if ocr_enabled is None:
+            ocr_enabled = self.settings.ocr.enable_auto_detect
+
+        return (
+            pipeline,
+            ocr_enabled,
+            user_options.enable_enrichments,
+            user_options.table_accuracy_mode or self.settings.pdf.table_accuracy_mode,
+            user_options.pdf_backend or self.settings.pdf.backend,
+        )
+
+    def _create_pipeline_options(
+        self, pipeline: ProcessingPipeline, user_options: PipelineUserOptions
+    ) -> dict[str, Any]:
+        """
+        Build pipeline configuration without consulting the cache.
+
+        Args:
+            pipeline: Pipeline type
+            user_options: User-provided options
+
+        Returns:
+            Pipeline configuration dictionary
+        """
+        # Unknown pipelines (including AUTO) default to standard
+        create = self._dispatch.get(pipeline, self.create_standard_pipeline_options)
+        return create(user_options)
 
     def get_supported_formats(self) -> dict[str, Any]:
         """
         Get list of supported input and output formats.
 
         Returns:
-            Dictionary with supported formats
+            Dictionary with supported formats (shared, do not modify)
         """
-        return {
-            "input_formats": [
-                "pdf",
-                "docx",
-                "xlsx",
-                "pptx",
-                "html",
-                "htm",
-                "xhtml",
-                "md",
-                "markdown",
-                "csv",
-                "png",
-                "jpg",
-                "jpeg",
-                "tiff",
-                "tif",
-                "bmp",
-                "webp",
-                "mp3",
-                "wav",
-                "m4a",
-                "flac",
-                "xml",
-            ],
-            "output_formats": ["markdown", "html", "json", "text", "doctags"],
-            "pipelines": ["standard", "vlm", "asr"],
-        }
+        return _SUPPORTED_FORMATS
@@ -3,18 +3,222 @@ Main document processor.
 """
 
 import asyncio
-import importlib.util
 import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from document_parser.config.models import ApplicationSettings
+from document_parser.config.models import ApplicationSettings, ProcessingSettings
 from document_parser.core.exceptions import ProcessingError
 from document_parser.engine.download_manager import DownloadManager
-from document_parser.engine.pipeline_factory import PipelineFactory
-from document_parser.processing.job import ProcessingPipeline
+from document_parser.engine.pipeline_factory import (
+    PipelineFactory,
+    PipelineUserOptions,
+)
+from document_parser.engine.result_spool import (
+    RESULT_PAGE_CHARS,
+    SpooledResult,
+    spool_markdown,
+)
+from document_parser.processing.job import ProcessingPipeline, parse_pipeline
 from document_parser.utils.file_utils import detect_document_type
+from document_parser.utils.logging_utils import (
+    get_worker_log_queue,
+    setup_worker_logging,
+)
 from document_parser.utils.network_utils import is_valid_url
+from document_parser.utils.system_utils import is_mlx_available
+
+# Converters kept per worker; each holds its own loaded models
+_MAX_CACHED_CONVERTERS = 4
+
+_ResultT = TypeVar("_ResultT", str, str | SpooledResult)
+
+# Conversion run in a worker: (file_path, pipeline, options) -> result
+_WorkerFn = Callable[[str, str, dict[str, Any]], _ResultT]
+
+
+class ConverterCache:
+    """
+    LRU cache of Docling converters keyed by pipeline and user options.
+
+    Converters keep their loaded models, so reusing them avoids paying model
+    initialization on every job.
+    """
+
+    def __init__(
+        self, settings: ProcessingSettings, max_size: int = _MAX_CACHED_CONVERTERS
+    ):
+        """
+        Initialize converter cache.
+
+        Args:
+            settings: Processing configuration settings
+            max_size: Maximum number of cached converters
+        """
+        self.pipeline_factory = PipelineFactory(settings)
+        self.max_size = max_size
+        self._converters: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pipeline: ProcessingPipeline, options: dict[str, Any]) -> Any:
+        """
+        Get a cached DocumentConverter for a pipeline and option set.
+
+        Args:
+            pipeline: Processing pipeline
+            options: Processing options
+
+        Returns:
+            Docling DocumentConverter
+
+        Raises:
+            ValueError: If an option has an invalid type or value
+        """
+        from docling.document_converter import DocumentConverter
+
+        key = self.pipeline_factory.options_key(
+            pipeline, PipelineUserOptions.from_dict(options)
+        )
+
+        with self._lock:
+            converter = self._converters.get(key)
+            if converter is None:
+                pipeline_options = self.pipeline_factory.create_pipeline_options(
+                    pipeline, options
+                )
+                converter = DocumentConverter(format_options=pipeline_options)
+                self._converters[key] = converter
+                if len(self._converters) > self.max_size:
+                    self._converters.popitem(last=False)
+            else:
+                self._converters.move_to_end(key)
+
+        return converter
+
+
+# Converter cache of the current worker process (set by _init_worker)
+_worker_converters: ConverterCache | None = None
+
+
+def _init_worker(
+    settings: ProcessingSettings,
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+    log_level: str,
+) -> None:
+    """
+    Initialize a processing worker process.
+
+    Args:
+        settings: Processing configuration settings
+        log_queue: Queue forwarding log records to the parent process
+        log_level: Log level name
+    """
+    global _worker_converters
+
+    # Spawned workers start with unconfigured logging; send records to the
+    # parent, which owns the console and log file handlers
+    setup_worker_logging(log_queue, log_level)
+
+    # Import Docling up front so the first job doesn't pay for it
+    import docling.document_converter  # noqa: F401
+
+    _worker_converters = ConverterCache(settings)
+
+
+def _get_worker_converters() -> ConverterCache:
+    """
+    Get the converter cache of the current worker process.
+
+    Returns:
+        Worker converter cache
+
+    Raises:
+        RuntimeError: If called outside an initialized worker
+    """
+    if _worker_converters is None:
+        raise RuntimeError("Worker process not initialized")
+    return _worker_converters
+
+
+def _process_in_worker(
+    file_path: str,
+    pipeline: str,
+    options: dict[str, Any],
+) -> str:
+    """
+    Synchronous document processing (runs in a worker process).
+
+    Args:
+        file_path: Path to file
+        pipeline: Processing pipeline name
+        options: Processing options
+
+    Returns:
+        Markdown content
+    """
+    converter = _get_worker_converters().get(ProcessingPipeline(pipeline), options)
+
+    # Convert document
+    result = converter.convert(file_path)
+    document = result.document
+
+    # Export to markdown
+    markdown: str = document.export_to_markdown()
+    return markdown
+
+
+def _process_in_worker_paged(
+    file_path: str,
+    pipeline: str,
+    options: dict[str, Any],
+    spool_directory: str,
+    threshold: int,
+) -> str | SpooledResult:
+    """
+    Process a document, spooling large results to a file (runs in a worker).
+
+    Args:
+        file_path: Path to file
+        pipeline: Processing pipeline name
+        options: Processing options
+        spool_directory: Directory for spooled result files
+        threshold: Results longer than this many characters are spooled
+
+    Returns:
+        Markdown content, or the spooled result if it spans several pages
+    """
+    markdown = _process_in_worker(file_path, pipeline, options)
+    if len(markdown) <= max(threshold, RESULT_PAGE_CHARS):
+        return markdown
+
+    return spool_markdown(markdown, spool_directory)
+
+
+def _warmup_worker(pipeline: str) -> None:
+    """
+    Build and initialize the converter for a pipeline (runs in a worker).
+
+    Args:
+        pipeline: Processing pipeline name
+    """
+    pipeline_enum = ProcessingPipeline(pipeline)
+    converters = _get_worker_converters()
+    converter = converters.get(pipeline_enum, {})
+
+    # Load the models for each input format the pipeline handles
+    format_options = converters.pipeline_factory.create_pipeline_options(
+        pipeline_enum, {}
+    )
+    for input_format in format_options:
+        converter.initialize_pipeline(input_format)
 
 
 class DocumentProcessor:
@@ -34,16 +238,47 @@ class DocumentProcessor:
         self.download_manager = DownloadManager(settings.storage)
         self.pipeline_factory = PipelineFactory(settings.processing)
 
+        # Suggested pipeline per known file extension, so auto-detection for
+        # supported formats is a single dict lookup
+        self._ext_pipelines = {
+            f".{fmt}": detect_document_type(f"document.{fmt}")[1]
+            for fmt in self.pipeline_factory.get_supported_formats()["input_formats"]
+        }
+
+        self._executor = self._create_executor()
+
         # Check Docling availability
         self._verify_dependencies()
 
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """
+        Create the worker process pool.
+
+        Docling work is CPU-bound, so it runs in worker processes rather than
+        threads to avoid serializing jobs on the GIL. Workers are spawned (not
+        forked) because the parent runs an event loop and background threads.
+
+        Returns:
+            Process pool executor
+        """
+        return ProcessPoolExecutor(
+            max_workers=self.settings.server.max_concurrent_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.settings.processing,
+                get_worker_log_queue(),
+                self.settings.logging.level,
+            ),
+        )
+
     def _verify_dependencies(self) -> None:
         """Verify that Docling is available."""
         try:
             import docling
 
             version = getattr(docling, "__version__", "unknown")
-            self._logger.info(f"Docling version: {version}")
+            self._logger.info("Docling version: %s", version)
         except ImportError:
             raise ProcessingError(
                 "Docling library not installed",
@@ -52,7 +287,7 @@ class DocumentProcessor:
 
         # Check MLX if enabled
         if self.settings.processing.performance.enable_mlx_acceleration:
-            if importlib.util.find_spec("mlx") is not None:
+            if is_mlx_available():
                 self._logger.info("MLX acceleration available")
             else:
                 self._logger.warning("MLX not available, using CPU/GPU fallback")
@@ -74,6 +309,65 @@ class DocumentProcessor:
         Returns:
             Markdown content
 
+        Raises:
+            ProcessingError: If processing fails
+        """
+        return await self._process(source, pipeline, options, _process_in_worker)
+
+    async def process_document_paged(
+        self,
+        source: str,
+        pipeline: str | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> str | SpooledResult:
+        """
+        Process a document, returning large results as a paged file.
+
+        Results longer than ``server.stream_threshold`` characters are written
+        to the temp directory by the worker; the caller reads them page by page
+        and must discard the result when done.
+
+        Args:
+            source: File path or URL to document
+            pipeline: Processing pipeline to use (None for auto-detect)
+            options: Additional processing options
+
+        Returns:
+            Markdown content, or the spooled result
+
+        Raises:
+            ProcessingError: If processing fails
+        """
+        threshold = self.settings.server.stream_threshold
+        if not threshold:
+            return await self.process_document(source, pipeline, options)
+
+        worker_fn = partial(
+            _process_in_worker_paged,
+            spool_directory=self.settings.storage.temp_directory,
+            threshold=threshold,
+        )
+        return await self._process(source, pipeline, options, worker_fn)
+
+    async def _process(
+        self,
+        source: str,
+        pipeline: str | None,
+        options: dict[str, Any] | None,
+        worker_fn: _WorkerFn[_ResultT],
+    ) -> _ResultT:
+        """
+        Fetch a document and convert it in a worker process.
+
+        Args:
+            source: File path or URL to document
+            pipeline: Processing pipeline to use (None for auto-detect)
+            options: Additional processing options
+            worker_fn: Conversion to run in the worker
+
+        Returns:
+            Result of the conversion
+
         Raises:
             ProcessingError: If processing fails
         """
@@ -82,6 +376,9 @@ class DocumentProcessor:
         is_remote = is_valid_url(source)
 
         try:
+            # Reject invalid options before downloading anything
+            PipelineUserOptions.from_dict(options)
+
             # Download if URL
             if is_remote:
                 local_path = await self.download_manager.download_file(source)
@@ -94,29 +391,29 @@ class DocumentProcessor:
 
             # Auto-detect pipeline if not specified
             if not pipeline and self.settings.processing.enable_pipeline_auto_detect:
-                _, suggested_pipeline = detect_document_type(processing_path)
-                pipeline = suggested_pipeline
-                self._logger.info(f"Auto-detected pipeline: {pipeline}")
+                ext = os.path.splitext(processing_path)[1].lower()
+                pipeline = self._ext_pipelines.get(ext)
+                if pipeline is None:
+                    _, pipeline = detect_document_type(processing_path)
+                self._logger.info("Auto-detected pipeline: %s", pipeline)
 
             # Use default pipeline if still not set
             if not pipeline:
                 pipeline = self.settings.processing.default_pipeline
 
             # Convert pipeline string to enum
-            pipeline_enum = self._parse_pipeline(pipeline)
+            pipeline_enum = parse_pipeline(pipeline)
 
             # Process document
-            markdown_content = await self._execute_processing(
-                processing_path, pipeline_enum, options
+            return await self._execute_processing(
+                processing_path, pipeline_enum, options, worker_fn
             )
 
-            return markdown_content
-
         except ProcessingError:
             raise
 
         except Exception as e:
-            self._logger.error(f"Unexpected error processing {source}: {e}")
+            self._logger.error("Unexpected error processing %s: %s", source, e)
             raise ProcessingError(
                 f"Failed to process document: {source}", details=str(e)
             )
@@ -131,7 +428,8 @@ class DocumentProcessor:
         file_path: str,
         pipeline: ProcessingPipeline,
         options: dict[str, Any],
-    ) -> str:
+        worker_fn: _WorkerFn[_ResultT],
+    ) -> _ResultT:
         """
         Execute document processing with specified pipeline.
 
@@ -139,29 +437,36 @@ class DocumentProcessor:
             file_path: Path to file to process
             pipeline: Processing pipeline
             options: Processing options
+            worker_fn: Conversion to run in the worker
 
         Returns:
-            Markdown content
+            Result of the conversion
 
         Raises:
             ProcessingError: If processing fails
         """
-        self._logger.info(f"Processing {file_path} with {pipeline.value} pipeline")
+        self._logger.info("Processing %s with %s pipeline", file_path, pipeline.value)
 
         try:
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._process_sync, file_path, pipeline, options
-            )
+            result = await self._run_in_worker(file_path, pipeline, options, worker_fn)
 
+            chars = len(result) if isinstance(result, str) else result.chars
+            self._logger.info("Processing complete: %d characters", chars)
             return result
 
+        except ProcessingError:
+            # The worker crashed; don't risk crashing a fresh pool on retry
+            raise
+
         except Exception as e:
             # Try fallback if enabled
             if self.settings.retry.enable_pipeline_fallback:
-                self._logger.warning(f"Primary processing failed, trying fallback: {e}")
-                fallback_result = await self._try_fallback(file_path, pipeline, options)
+                self._logger.warning(
+                    "Primary processing failed, trying fallback: %s", e
+                )
+                fallback_result = await self._try_fallback(
+                    file_path, pipeline, options, worker_fn
+                )
 
                 if fallback_result:
                     return fallback_result
@@ -170,50 +475,77 @@ class DocumentProcessor:
                 f"Document processing failed for {file_path}", details=str(e)
             )
 
-    def _process_sync(
+    async def _run_in_worker(
         self,
         file_path: str,
         pipeline: ProcessingPipeline,
         options: dict[str, Any],
-    ) -> str:
+        worker_fn: _WorkerFn[_ResultT],
+    ) -> _ResultT:
         """
-        Synchronous document processing (runs in thread pool).
+        Run a conversion in the worker process pool.
 
         Args:
-            file_path: Path to file
+            file_path: Path to file to process
             pipeline: Processing pipeline
             options: Processing options
+            worker_fn: Conversion to run in the worker
 
         Returns:
-            Markdown content
+            Result of the conversion
+
+        Raises:
+            ProcessingError: If the worker process died during the conversion
         """
-        from docling.document_converter import DocumentConverter
+        loop = asyncio.get_running_loop()
+        executor = self._executor
 
-        # Get pipeline configuration
-        pipeline_options = self.pipeline_factory.create_pipeline_options(
-            pipeline, options
-        )
+        try:
+            result = await loop.run_in_executor(
+                executor, worker_fn, file_path, pipeline.value, options
+            )
+        except BrokenProcessPool as e:
+            # A crashed worker (e.g. OOM or a native fault) breaks the whole
+            # pool; replace it once so later jobs get fresh workers
+            if self._executor is executor:
+                self._logger.error("Worker process died, restarting worker pool")
+                self._executor = self._create_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise ProcessingError(
+                f"Worker process died while processing {file_path}", details=str(e)
+            ) from e
 
-        # Create converter
-        converter = DocumentConverter(format_options=pipeline_options)
+        return result
 
-        # Convert document
-        result = converter.convert(file_path)
-        document = result.document
+    async def warmup(self) -> None:
+        """
+        Load models for the default pipeline in every worker process.
 
-        # Export to markdown
-        markdown_content = document.export_to_markdown()
+        Failures are logged and otherwise ignored; the first request will
+        load the models instead.
+        """
+        pipeline = parse_pipeline(self.settings.processing.default_pipeline)
+        loop = asyncio.get_running_loop()
 
-        self._logger.info(f"Processing complete: {len(markdown_content)} characters")
+        try:
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, _warmup_worker, pipeline.value)
+                    for _ in range(self.settings.server.max_concurrent_jobs)
+                )
+            )
+            self._logger.info("Warmed up %s pipeline", pipeline.value)
 
-        return markdown_content
+        except Exception as e:
+            self._logger.warning("Pipeline warmup failed: %s", e)
 
     async def _try_fallback(
         self,
         file_path: str,
         original_pipeline: ProcessingPipeline,
         options: dict[str, Any],
-    ) -> str | None:
+        worker_fn: _WorkerFn[_ResultT],
+    ) -> _ResultT | None:
         """
         Try fallback processing strategies.
 
@@ -221,60 +553,45 @@ class DocumentProcessor:
             file_path: Path to file
             original_pipeline: Original pipeline that failed
             options: Processing options
+            worker_fn: Conversion to run in the worker
 
         Returns:
-            Markdown content if successful, None otherwise
+            Result of the conversion if successful, None otherwise
         """
-        fallback_strategies = []
+        fallback_strategies: list[tuple[ProcessingPipeline, dict[str, Any]]] = []
 
         # Define fallback strategies based on original pipeline
         if original_pipeline == ProcessingPipeline.VLM:
-            fallback_strategies.append(ProcessingPipeline.STANDARD)
+            fallback_strategies.append((ProcessingPipeline.STANDARD, options))
         elif original_pipeline == ProcessingPipeline.STANDARD:
             # Try with different backend
             if self.settings.retry.enable_backend_fallback:
-                fallback_options = options.copy()
-                fallback_options["pdf_backend"] = (
-                    self.settings.processing.pdf.fallback_backend
+                fallback_options = {
+                    **options,
+                    "pdf_backend": self.settings.processing.pdf.fallback_backend,
+                }
+                fallback_strategies.append(
+                    (ProcessingPipeline.STANDARD, fallback_options)
                 )
-                fallback_strategies.append(ProcessingPipeline.STANDARD)
 
         # Try each fallback
-        for fallback_pipeline in fallback_strategies:
+        for fallback_pipeline, fallback_options in fallback_strategies:
             try:
-                self._logger.info(f"Trying fallback: {fallback_pipeline.value}")
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, self._process_sync, file_path, fallback_pipeline, options
+                self._logger.info("Trying fallback: %s", fallback_pipeline.value)
+                result = await self._run_in_worker(
+                    file_path, fallback_pipeline, fallback_options, worker_fn
                 )
                 self._logger.info("Fallback processing succeeded")
                 return result
 
             except Exception as e:
-                self._logger.warning(f"Fallback {fallback_pipeline.value} failed: {e}")
+                self._logger.warning(
+                    "Fallback %s failed: %s", fallback_pipeline.value, e
+                )
                 continue
 
         return None
 
-    def _parse_pipeline(self, pipeline: str) -> ProcessingPipeline:
-        """
-        Parse pipeline string to enum.
-
-        Args:
-            pipeline: Pipeline name
-
-        Returns:
-            ProcessingPipeline enum
-        """
-        pipeline_map = {
-            "standard": ProcessingPipeline.STANDARD,
-            "vlm": ProcessingPipeline.VLM,
-            "asr": ProcessingPipeline.ASR,
-            "auto": ProcessingPipeline.AUTO,
-        }
-
-        return pipeline_map.get(pipeline.lower(), ProcessingPipeline.STANDARD)
-
     def get_supported_formats(self) -> dict[str, Any]:
         """
         Get supported document formats.
@@ -283,3 +600,8 @@ class DocumentProcessor:
             Dictionary with supported formats
         """
         return self.pipeline_factory.get_supported_formats()
+
+    async def aclose(self) -> None:
+        """Release resources held by the processor."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        await self.download_manager.aclose()
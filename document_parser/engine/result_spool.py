@@ -0,0 +1,94 @@
+"""
+Paged storage of large conversion results.
+"""
+
+import os
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass
+
+from document_parser.utils.file_utils import ensure_directory
+
+# Characters per page of a spooled result
+RESULT_PAGE_CHARS = 256 * 1024
+
+
+@dataclass(frozen=True)
+class SpooledResult:
+    """
+    Markdown result written to a file in fixed-size pages.
+
+    Workers return this instead of the markdown text for large results, so
+    the text never crosses the process boundary or sits whole in server
+    memory; pages are read back one at a time.
+    """
+
+    path: str
+    # Byte offset of each page start, followed by the file size
+    page_offsets: tuple[int, ...]
+    # Length of the whole result in characters
+    chars: int
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the result."""
+        return len(self.page_offsets) - 1
+
+    def read_page(self, page: int) -> str:
+        """
+        Read one page of the result.
+
+        Args:
+            page: Zero-based page index
+
+        Returns:
+            Markdown text of the page
+
+        Raises:
+            ValueError: If the page is out of range
+        """
+        if not 0 <= page < self.page_count:
+            raise ValueError(f"page must be from 0 to {self.page_count - 1}: {page!r}")
+
+        start = self.page_offsets[page]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(self.page_offsets[page + 1] - start)
+
+        return data.decode("utf-8")
+
+    def discard(self) -> None:
+        """Delete the result file."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+
+def spool_markdown(
+    markdown: str, directory: str, page_chars: int = RESULT_PAGE_CHARS
+) -> SpooledResult:
+    """
+    Write markdown to a file in pages.
+
+    Args:
+        markdown: Markdown text
+        directory: Directory for the result file
+        page_chars: Characters per page
+
+    Returns:
+        Spooled result describing the file
+    """
+    ensure_directory(directory)
+    fd, path = tempfile.mkstemp(prefix="result-", suffix=".md", dir=directory)
+
+    offsets = [0]
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(markdown), page_chars):
+                f.write(markdown[start : start + page_chars].encode("utf-8"))
+                offsets.append(f.tell())
+
+    except BaseException:
+        os.unlink(path)
+        raise
+
+    return SpooledResult(path, tuple(offsets), len(markdown))
@@ -2,20 +2,33 @@
 MCP tool handlers.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 import mcp.types as types
 
 from document_parser.config.models import ApplicationSettings
 from document_parser.core.exceptions import ProcessingError
 from document_parser.engine.processor import DocumentProcessor
-from document_parser.processing.job import Job, ProcessingPipeline
-from document_parser.processing.task_queue import TaskQueue
+from document_parser.engine.result_spool import SpooledResult
+from document_parser.processing.job import Job, ProcessingPipeline, parse_pipeline
+from document_parser.processing.job_scheduler import JobScheduler
 from document_parser.processing.task_tracker import TaskTracker
+from document_parser.utils.json_utils import dumps_json
+from document_parser.utils.network_utils import is_valid_url
 from document_parser.utils.system_utils import generate_unique_id
 
+# Scheduling priority of jobs that don't ask for one (0 is most urgent)
+DEFAULT_PRIORITY = 5
+
+# Scheduling group of sources that are not URLs
+LOCAL_GROUP = "local"
+
+_ResultT = TypeVar("_ResultT", str, str | SpooledResult)
+
 
 class ToolHandlers:
     """
@@ -26,7 +39,6 @@ class ToolHandlers:
         self,
         settings: ApplicationSettings,
         processor: DocumentProcessor,
-        task_queue: TaskQueue,
         task_tracker: TaskTracker,
     ):
         """
@@ -35,15 +47,25 @@ class ToolHandlers:
         Args:
             settings: Application settings
             processor: Document processor
-            task_queue: Task queue
             task_tracker: Task tracker
         """
         self.settings = settings
         self.processor = processor
-        self.task_queue = task_queue
         self.task_tracker = task_tracker
         self._logger = logging.getLogger(__name__)
 
+        # Bounds concurrent processing; jobs wait here for a free slot and
+        # are admitted fairly across source hosts, then by priority
+        self._scheduler = JobScheduler(settings.server.max_concurrent_jobs)
+        self._waiting_jobs = 0
+        self._running_jobs = 0
+
+        # Paged results not yet read to the end, by job ID
+        self._spooled: dict[str, SpooledResult] = {}
+
+        # Supported formats never change, so serialize them once
+        self._formats_json: str | None = None
+
     async def handle_parse_document(
         self, arguments: dict[str, Any]
     ) -> list[types.TextContent]:
@@ -63,57 +85,238 @@ class ToolHandlers:
         pipeline = arguments.get("pipeline", "auto")
         options = arguments.get("options", {})
 
-        self._logger.info(f"Parsing document: {source}")
+        priority = arguments.get("priority", DEFAULT_PRIORITY)
+        if type(priority) is not int or not 0 <= priority <= 9:
+            raise ValueError(f"priority must be an integer from 0 to 9: {priority!r}")
+
+        if isinstance(source, list):
+            return await self._parse_batch(source, pipeline, options, priority)
+
+        self._logger.info("Parsing document: %s", source)
 
         try:
-            # Create job
-            job_id = generate_unique_id("job")
-            pipeline_enum = self._parse_pipeline_string(pipeline)
+            job = self._create_job(source, pipeline, options, priority)
+            result = await self._run_job(job, self.processor.process_document_paged)
+            if isinstance(result, SpooledResult):
+                self._store_spooled(job.job_id, result)
+                return await self._read_page(job.job_id, 0)
 
-            job = Job(
-                job_id=job_id,
-                source_path=source,
-                pipeline=pipeline_enum,
-                options=options,
-            )
+            return [types.TextContent(type="text", text=result)]
 
-            # Register and queue job
-            self.task_tracker.register_job(job)
-            queued = await self.task_queue.enqueue(job)
+        except ProcessingError:
+            raise
 
-            if not queued:
-                raise ProcessingError("Queue is full, please try again later")
+        except Exception as e:
+            self._logger.error("Error parsing document: %s", e)
+            raise ProcessingError(f"Document parsing failed: {str(e)}")
 
-            # Process job
-            job = await self.task_queue.dequeue()
-            if not job:
-                raise ProcessingError("Failed to retrieve job from queue")
+    async def _parse_batch(
+        self,
+        sources: list[str],
+        pipeline: str,
+        options: dict[str, Any],
+        priority: int,
+    ) -> list[types.TextContent]:
+        """
+        Parse several documents concurrently.
 
-            self.task_tracker.mark_active(job.job_id)
+        Downloads and conversions overlap, bounded by the processing slots.
+        A failing source doesn't abort the others; its result is an error
+        message instead.
 
-            try:
-                # Process document
-                markdown_result = await self.processor.process_document(
-                    job.source_path, job.pipeline.value, job.options
-                )
+        Args:
+            sources: File paths or URLs
+            pipeline: Processing pipeline name
+            options: Processing options shared by all documents
+            priority: Scheduling priority shared by all documents
 
-                # Mark completed
-                job.mark_completed(markdown_result)
-                self.task_tracker.mark_inactive(job.job_id)
+        Returns:
+            List of TextContent, one per source in input order
+        """
+        self._logger.info("Parsing %s documents", len(sources))
+
+        results = await asyncio.gather(
+            *[
+                self._process_one(source, pipeline, options, priority)
+                for source in sources
+            ],
+            return_exceptions=True,
+        )
+
+        contents = []
+        for source, result in zip(sources, results, strict=True):
+            if isinstance(result, BaseException):
+                self._logger.error("Error parsing document %s: %s", source, result)
+                result = f"Error: {result}"
+            contents.append(types.TextContent(type="text", text=result))
+
+        return contents
+
+    async def _process_one(
+        self,
+        source: str,
+        pipeline: str,
+        options: dict[str, Any],
+        priority: int = DEFAULT_PRIORITY,
+    ) -> str:
+        """
+        Track and process a single document once a slot is free.
 
-                return [types.TextContent(type="text", text=markdown_result)]
+        Args:
+            source: File path or URL
+            pipeline: Processing pipeline name
+            options: Processing options
+            priority: Scheduling priority (lower values are admitted first)
 
-            except Exception as e:
-                job.mark_failed(str(e))
-                self.task_tracker.mark_inactive(job.job_id)
-                raise
+        Returns:
+            Markdown content
+        """
+        job = self._create_job(source, pipeline, options, priority)
+        return await self._run_job(job, self.processor.process_document)
 
-        except ProcessingError:
-            raise
+    @staticmethod
+    def _create_job(
+        source: str, pipeline: str, options: dict[str, Any], priority: int
+    ) -> Job:
+        """
+        Create a job for a single document.
+
+        Args:
+            source: File path or URL
+            pipeline: Processing pipeline name
+            options: Processing options
+            priority: Scheduling priority (lower values are admitted first)
+
+        Returns:
+            New pending job
+        """
+        return Job(
+            job_id=generate_unique_id("job"),
+            source_path=source,
+            pipeline=parse_pipeline(pipeline, ProcessingPipeline.AUTO),
+            options=options,
+            priority=priority,
+        )
+
+    async def _run_job(
+        self,
+        job: Job,
+        process: Callable[[str, str, dict[str, Any]], Awaitable[_ResultT]],
+    ) -> _ResultT:
+        """
+        Track a job and run it once a processing slot is free.
+
+        Args:
+            job: Job to run
+            process: Processor method converting the document
+
+        Returns:
+            Result of the conversion
+        """
+        # Register job and wait for a processing slot
+        self.task_tracker.register_job(job)
+        job.mark_queued()
+
+        group_key = self._group_key(job.source_path)
+        weight = self.settings.server.scheduling_weights.get(group_key, 1)
+
+        self._waiting_jobs += 1
+        try:
+            await self._scheduler.acquire(job, group_key, weight)
+        finally:
+            self._waiting_jobs -= 1
+
+        self._running_jobs += 1
+        try:
+            job.mark_running()
+            self.task_tracker.mark_active(job.job_id)
+
+            # Process document
+            result = await process(job.source_path, job.pipeline.value, job.options)
+
+            # Mark completed; paged results stay on disk only
+            job.mark_completed(result if isinstance(result, str) else None)
+
+            return result
 
         except Exception as e:
-            self._logger.error(f"Error parsing document: {e}")
-            raise ProcessingError(f"Document parsing failed: {str(e)}")
+            job.mark_failed(str(e))
+            raise
+
+        finally:
+            self.task_tracker.mark_inactive(job.job_id)
+            self._running_jobs -= 1
+            self._scheduler.release()
+
+    @staticmethod
+    def _group_key(source: str) -> str:
+        """
+        Get the scheduling group of a source.
+
+        Args:
+            source: File path or URL
+
+        Returns:
+            Host name for URLs, LOCAL_GROUP for local files
+        """
+        if is_valid_url(source):
+            return urlsplit(source).hostname or LOCAL_GROUP
+
+        return LOCAL_GROUP
+
+    def _store_spooled(self, job_id: str, result: SpooledResult) -> None:
+        """
+        Keep a paged result for later page requests.
+
+        Results of jobs that have left the tracker history are dropped, so
+        unread results can't accumulate.
+
+        Args:
+            job_id: Job that produced the result
+            result: Spooled result
+        """
+        for stale_id in [
+            stale_id
+            for stale_id in self._spooled
+            if self.task_tracker.get_job(stale_id) is None
+        ]:
+            self._spooled.pop(stale_id).discard()
+
+        self._spooled[job_id] = result
+
+    async def _read_page(self, job_id: str, page: int) -> list[types.TextContent]:
+        """
+        Read one page of a paged result.
+
+        The result is deleted once its last page has been read.
+
+        Args:
+            job_id: Job that produced the result
+            page: Zero-based page index
+
+        Returns:
+            Page text followed by JSON paging information
+        """
+        result = self._spooled.get(job_id)
+        if result is None:
+            raise ValueError(f"No paged result for job: {job_id}")
+
+        text = await asyncio.to_thread(result.read_page, page)
+        if page == result.page_count - 1:
+            del self._spooled[job_id]
+            await asyncio.to_thread(result.discard)
+
+        paging = {"job_id": job_id, "page": page, "total_pages": result.page_count}
+        return [
+            types.TextContent(type="text", text=text),
+            types.TextContent(type="text", text=dumps_json(paging)),
+        ]
+
+    def discard_results(self) -> None:
+        """Delete all paged results that haven't been read to the end."""
+        for result in self._spooled.values():
+            result.discard()
+        self._spooled.clear()
 
     async def handle_parse_document_advanced(
         self, arguments: dict[str, Any]
@@ -145,13 +348,14 @@ class ToolHandlers:
         # Remove None values
         options = {k: v for k, v in options.items() if v is not None}
 
-        self._logger.info(f"Advanced parsing: {source} with pipeline: {pipeline}")
+        self._logger.info("Advanced parsing: %s with pipeline: %s", source, pipeline)
 
         # Use same logic as basic parsing
         arguments_copy = {
             "source": source,
             "pipeline": pipeline,
             "options": options,
+            "priority": arguments.get("priority", DEFAULT_PRIORITY),
         }
 
         return await self.handle_parse_document(arguments_copy)
@@ -176,9 +380,29 @@ class ToolHandlers:
         if not job:
             raise ValueError(f"Job not found: {job_id}")
 
-        status_data = job.to_dict()
+        return [types.TextContent(type="text", text=job.to_json())]
 
-        return [types.TextContent(type="text", text=json.dumps(status_data, indent=2))]
+    async def handle_get_result_page(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        """
+        Handle paged result request.
+
+        Args:
+            arguments: Tool arguments
+
+        Returns:
+            List of TextContent with the page text and paging information
+        """
+        job_id = arguments.get("job_id")
+        if not job_id:
+            raise ValueError("Missing required parameter: job_id")
+
+        page = arguments.get("page")
+        if type(page) is not int or page < 0:
+            raise ValueError(f"page must be a non-negative integer: {page!r}")
+
+        return await self._read_page(job_id, page)
 
     async def handle_list_supported_formats(
         self, arguments: dict[str, Any]
@@ -192,9 +416,10 @@ class ToolHandlers:
         Returns:
             List of TextContent with formats
         """
-        formats = self.processor.get_supported_formats()
+        if self._formats_json is None:
+            self._formats_json = dumps_json(self.processor.get_supported_formats())
 
-        return [types.TextContent(type="text", text=json.dumps(formats, indent=2))]
+        return [types.TextContent(type="text", text=self._formats_json)]
 
     async def handle_get_queue_statistics(
         self, arguments: dict[str, Any]
@@ -208,7 +433,14 @@ class ToolHandlers:
         Returns:
             List of TextContent with statistics
         """
-        queue_stats = self.task_queue.get_stats()
+        max_jobs = self.settings.server.max_concurrent_jobs
+        queue_stats = {
+            "running_jobs": self._running_jobs,
+            "waiting_jobs": self._waiting_jobs,
+            "max_concurrent_jobs": max_jobs,
+            "is_full": self._running_jobs >= max_jobs,
+            "is_empty": not (self._running_jobs or self._waiting_jobs),
+        }
         tracker_stats = self.task_tracker.get_statistics()
 
         combined_stats = {
@@ -216,25 +448,4 @@ class ToolHandlers:
             "processing": tracker_stats,
         }
 
-        return [
-            types.TextContent(type="text", text=json.dumps(combined_stats, indent=2))
-        ]
-
-    def _parse_pipeline_string(self, pipeline: str) -> ProcessingPipeline:
-        """
-        Parse pipeline string to enum.
-
-        Args:
-            pipeline: Pipeline name
-
-        Returns:
-            ProcessingPipeline enum
-        """
-        pipeline_map = {
-            "standard": ProcessingPipeline.STANDARD,
-            "vlm": ProcessingPipeline.VLM,
-            "asr": ProcessingPipeline.ASR,
-            "auto": ProcessingPipeline.AUTO,
-        }
-
-        return pipeline_map.get(pipeline.lower(), ProcessingPipeline.AUTO)
+        return [types.TextContent(type="text", text=dumps_json(combined_stats))]
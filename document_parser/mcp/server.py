@@ -14,9 +14,8 @@ from document_parser.config.models import ApplicationSettings
 from document_parser.engine.processor import DocumentProcessor
 from document_parser.mcp.handlers import ToolHandlers
 from document_parser.mcp.tools import get_tool_definitions
-from document_parser.processing.task_queue import TaskQueue
 from document_parser.processing.task_tracker import TaskTracker
-from document_parser.utils.file_utils import cleanup_old_files
+from document_parser.utils.file_utils import cleanup_old_files_async
 
 
 class DocumentParserServer:
@@ -36,14 +35,12 @@ class DocumentParserServer:
 
         # Initialize components
         self.processor = DocumentProcessor(settings)
-        self.task_queue = TaskQueue(max_size=settings.server.max_concurrent_jobs)
         self.task_tracker = TaskTracker(max_history=100)
 
         # Initialize tool handlers
         self.handlers = ToolHandlers(
             settings=settings,
             processor=self.processor,
-            task_queue=self.task_queue,
             task_tracker=self.task_tracker,
         )
 
@@ -54,6 +51,15 @@ class DocumentParserServer:
 
     def _register_handlers(self) -> None:
         """Register MCP tool handlers."""
+        # Tool name to handler, so dispatch is a single lookup
+        self._dispatch = {
+            "parse_document": self.handlers.handle_parse_document,
+            "parse_document_advanced": self.handlers.handle_parse_document_advanced,
+            "get_job_status": self.handlers.handle_get_job_status,
+            "get_result_page": self.handlers.handle_get_result_page,
+            "list_supported_formats": self.handlers.handle_list_supported_formats,
+            "get_queue_statistics": self.handlers.handle_get_queue_statistics,
+        }
 
         @self.server.list_tools()
         async def handle_list_tools():
@@ -64,21 +70,14 @@ class DocumentParserServer:
         async def handle_call_tool(name: str, arguments: dict[str, Any]):
             """Handle tool calls."""
             try:
-                if name == "parse_document":
-                    return await self.handlers.handle_parse_document(arguments)
-                elif name == "parse_document_advanced":
-                    return await self.handlers.handle_parse_document_advanced(arguments)
-                elif name == "get_job_status":
-                    return await self.handlers.handle_get_job_status(arguments)
-                elif name == "list_supported_formats":
-                    return await self.handlers.handle_list_supported_formats(arguments)
-                elif name == "get_queue_statistics":
-                    return await self.handlers.handle_get_queue_statistics(arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
 
+                return await handler(arguments)
+
             except Exception as e:
-                self._logger.error(f"Tool call error ({name}): {e}")
+                self._logger.error("Tool call error (%s): %s", name, e)
                 return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
     def _start_background_tasks(self) -> None:
@@ -88,8 +87,9 @@ class DocumentParserServer:
             """Periodic cleanup of temporary files and old jobs."""
             while True:
                 try:
-                    # Cleanup temp files
-                    cleanup_old_files(
+                    # Cleanup temp files off the event loop; the directory
+                    # scan would otherwise stall request handling
+                    await cleanup_old_files_async(
                         self.settings.storage.temp_directory,
                         self.settings.storage.cleanup_interval_hours,
                     )
@@ -101,21 +101,43 @@ class DocumentParserServer:
                     await asyncio.sleep(3600)
 
                 except Exception as e:
-                    self._logger.error(f"Cleanup task error: {e}")
+                    self._logger.error("Cleanup task error: %s", e)
                     await asyncio.sleep(300)  # Wait 5 minutes on error
 
         # Start cleanup task
-        asyncio.create_task(cleanup_task())
+        self._cleanup_task = asyncio.create_task(cleanup_task())
+
+        # Load models in the background so the first request is fast
+        self._warmup_task = None
+        if self.settings.server.warmup_on_start:
+            self._warmup_task = asyncio.create_task(self.processor.warmup())
 
     async def run(self) -> None:
         """Run the MCP server."""
         self._logger.info(
-            f"Starting {self.settings.server.name} v{self.settings.server.version}"
+            "Starting %s v%s", self.settings.server.name, self.settings.server.version
         )
 
-        # Use stdio transport
-        async with mcp.server.stdio.stdio_server() as (
-            read_stream,
-            write_stream,
-        ):
-            await self.server.run(read_stream, write_stream, NotificationOptions())
+        try:
+            # Use stdio transport
+            async with mcp.server.stdio.stdio_server() as (
+                read_stream,
+                write_stream,
+            ):
+                await self.server.run(read_stream, write_stream, NotificationOptions())
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shut down server components and release their resources."""
+        tasks = [
+            task for task in (self._cleanup_task, self._warmup_task) if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+
+        # Let the tasks finish unwinding before the loop goes away
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.handlers.discard_results()
+        await self.processor.aclose()
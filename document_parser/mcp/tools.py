@@ -2,15 +2,20 @@
 MCP tool definitions.
 """
 
+from functools import cache
+
 import mcp.types as types
 
 
+@cache
 def get_tool_definitions() -> list[types.Tool]:
     """
     Get MCP tool definitions.
 
+    The definitions are static, so they are built once and shared.
+
     Returns:
-        List of Tool definitions
+        List of Tool definitions (shared, do not modify)
     """
     return [
         types.Tool(
@@ -20,14 +25,23 @@ def get_tool_definitions() -> list[types.Tool]:
                 "type": "object",
                 "properties": {
                     "source": {
-                        "type": "string",
-                        "description": "File path or URL to the document",
+                        "oneOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "File path or URL to the document, or a list of them to parse concurrently",
                     },
                     "pipeline": {
                         "type": "string",
                         "enum": ["standard", "vlm", "asr", "auto"],
                         "description": "Processing pipeline (optional, auto-detected if not specified)",
                     },
+                    "priority": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "maximum": 9,
+                        "description": "Scheduling priority when all processing slots are busy; lower runs first (default 5)",
+                    },
                     "options": {
                         "type": "object",
                         "description": "Additional processing options",
@@ -75,6 +89,12 @@ def get_tool_definitions() -> list[types.Tool]:
                         "enum": ["standard", "vlm", "asr"],
                         "description": "Processing pipeline",
                     },
+                    "priority": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "maximum": 9,
+                        "description": "Scheduling priority when all processing slots are busy; lower runs first (default 5)",
+                    },
                     "ocr_enabled": {
                         "type": "boolean",
                         "description": "Enable/disable OCR",
@@ -115,6 +135,25 @@ def get_tool_definitions() -> list[types.Tool]:
                 "required": ["job_id"],
             },
         ),
+        types.Tool(
+            name="get_result_page",
+            description="Get a page of a large parse result",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job identifier from the paging information of a parse result",
+                    },
+                    "page": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Zero-based page index",
+                    },
+                },
+                "required": ["job_id", "page"],
+            },
+        ),
         types.Tool(
             name="list_supported_formats",
             description="List all supported input formats and processing pipelines",
@@ -6,7 +6,9 @@ from document_parser.processing.job import (
     Job,
     JobStatus,
     ProcessingPipeline,
+    parse_pipeline,
 )
+from document_parser.processing.job_scheduler import JobScheduler
 from document_parser.processing.task_queue import TaskQueue
 from document_parser.processing.task_tracker import TaskTracker
 
@@ -14,6 +16,8 @@ __all__ = [
     "Job",
     "JobStatus",
     "ProcessingPipeline",
+    "parse_pipeline",
+    "JobScheduler",
     "TaskQueue",
     "TaskTracker",
 ]
@@ -2,11 +2,16 @@
 Job model and status definitions.
 """
 
+import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+from document_parser.utils.json_utils import dumps_json
+
 
 class JobStatus(Enum):
     """Status of a processing job."""
@@ -18,6 +23,10 @@ class JobStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+    # Members are singletons compared by identity, so hash them by identity
+    # too; Enum's default hashes the name in Python on every dict lookup
+    __hash__ = object.__hash__
+
 
 class ProcessingPipeline(Enum):
     """Available processing pipelines."""
@@ -27,8 +36,45 @@ class ProcessingPipeline(Enum):
     ASR = "asr"
     AUTO = "auto"
 
+    __hash__ = object.__hash__
+
+
+_PIPELINE_MAP: dict[str, ProcessingPipeline] = {p.value: p for p in ProcessingPipeline}
+
+
+def parse_pipeline(
+    name: str | None,
+    default: ProcessingPipeline = ProcessingPipeline.STANDARD,
+) -> ProcessingPipeline:
+    """
+    Parse a pipeline name to enum, case-insensitively.
+
+    Args:
+        name: Pipeline name
+        default: Pipeline to return for empty or unknown names
 
-@dataclass
+    Returns:
+        ProcessingPipeline enum
+    """
+    return _PIPELINE_MAP.get(name.lower() if name else "", default)
+
+
+def _from_timestamp(timestamp: float | None) -> datetime | None:
+    """
+    Convert an epoch timestamp to an aware UTC datetime.
+
+    Args:
+        timestamp: Seconds since the epoch, or None
+
+    Returns:
+        UTC datetime, or None if no timestamp was given
+    """
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+@dataclass(slots=True)
 class Job:
     """
     Represents a document processing job.
@@ -39,33 +85,77 @@ class Job:
     pipeline: ProcessingPipeline
     options: dict[str, Any] = field(default_factory=dict)
     status: JobStatus = JobStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: datetime | None = None
-    completed_at: datetime | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     result_data: str | None = None
     error_message: str | None = None
     error_details: str | None = None
     retry_count: int = 0
+    # Scheduling priority; lower values are admitted first
+    priority: int = 5
+
+    # Wall-clock transition times as epoch seconds; datetimes and their ISO
+    # strings are only built when read
+    _started_ts: float | None = field(default=None, init=False, repr=False)
+    _completed_ts: float | None = field(default=None, init=False, repr=False)
+    _created_iso: str | None = field(default=None, init=False, repr=False)
+    _started_iso: str | None = field(default=None, init=False, repr=False)
+    _completed_iso: str | None = field(default=None, init=False, repr=False)
+    _duration: float | None = field(default=None, init=False, repr=False)
+    # Monotonic start time, so durations are immune to wall-clock changes
+    _start_ns: int = field(default=0, init=False, repr=False)
+    # Enum values used by to_dict, captured when the enum is set
+    _status_str: str = field(init=False, repr=False)
+    _pipeline_str: str = field(init=False, repr=False)
+    # Called with (job, previous_status) after each status change
+    _on_status_change: Callable[["Job", JobStatus], None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Cache the serialized status and pipeline."""
+        # The same document is often parsed repeatedly; share one path string
+        self.source_path = sys.intern(self.source_path)
+        self._status_str = self.status.value
+        self._pipeline_str = self.pipeline.value
+
+    def _set_status(self, status: JobStatus) -> None:
+        """
+        Update the job status and its cached string value.
+
+        Transition methods call this last, so observers see the job's
+        final state for the new status.
+
+        Args:
+            status: New job status
+        """
+        previous = self.status
+        self.status = status
+        self._status_str = status.value
+
+        if self._on_status_change is not None:
+            self._on_status_change(self, previous)
 
     def mark_queued(self) -> None:
         """Mark job as queued."""
-        self.status = JobStatus.QUEUED
+        self._set_status(JobStatus.QUEUED)
 
     def mark_running(self) -> None:
         """Mark job as running and record start time."""
-        self.status = JobStatus.RUNNING
-        self.started_at = datetime.now()
+        self._start_ns = time.monotonic_ns()
+        self._started_ts = time.time()
+        self._started_iso = None
+        self._set_status(JobStatus.RUNNING)
 
-    def mark_completed(self, result: str) -> None:
+    def mark_completed(self, result: str | None = None) -> None:
         """
         Mark job as completed and store result.
 
         Args:
-            result: Processing result data
+            result: Processing result data, if it should be kept
         """
-        self.status = JobStatus.COMPLETED
-        self.completed_at = datetime.now()
+        self._mark_finished()
         self.result_data = result
+        self._set_status(JobStatus.COMPLETED)
 
     def mark_failed(self, error: str, details: str | None = None) -> None:
         """
@@ -75,15 +165,32 @@ class Job:
             error: Error message
             details: Optional error details
         """
-        self.status = JobStatus.FAILED
-        self.completed_at = datetime.now()
+        self._mark_finished()
         self.error_message = error
         self.error_details = details
+        self._set_status(JobStatus.FAILED)
 
     def mark_cancelled(self) -> None:
         """Mark job as cancelled."""
-        self.status = JobStatus.CANCELLED
-        self.completed_at = datetime.now()
+        self._mark_finished()
+        self._set_status(JobStatus.CANCELLED)
+
+    def _mark_finished(self) -> None:
+        """Record completion time and duration."""
+        self._completed_ts = time.time()
+        self._completed_iso = None
+        if self._start_ns:
+            self._duration = (time.monotonic_ns() - self._start_ns) / 1e9
+
+    @property
+    def started_at(self) -> datetime | None:
+        """Time the job started running, or None if it hasn't started."""
+        return _from_timestamp(self._started_ts)
+
+    @property
+    def completed_at(self) -> datetime | None:
+        """Time the job finished, or None if it hasn't finished."""
+        return _from_timestamp(self._completed_ts)
 
     def increment_retry(self) -> None:
         """Increment retry counter."""
@@ -96,10 +203,7 @@ class Job:
         Returns:
             Duration in seconds, or None if not completed
         """
-        if self.started_at and self.completed_at:
-            delta = self.completed_at - self.started_at
-            return delta.total_seconds()
-        return None
+        return self._duration
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -108,17 +212,37 @@ class Job:
         Returns:
             Job data as dictionary
         """
+        # Format each timestamp once, the first time the job is serialized
+        # after it was recorded
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
+        if self._started_iso is None and self._started_ts is not None:
+            self._started_iso = datetime.fromtimestamp(
+                self._started_ts, timezone.utc
+            ).isoformat()
+        if self._completed_iso is None and self._completed_ts is not None:
+            self._completed_iso = datetime.fromtimestamp(
+                self._completed_ts, timezone.utc
+            ).isoformat()
+
         return {
             "job_id": self.job_id,
             "source_path": self.source_path,
-            "pipeline": self.pipeline.value,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "duration_seconds": self.get_duration_seconds(),
+            "pipeline": self._pipeline_str,
+            "status": self._status_str,
+            "created_at": self._created_iso,
+            "started_at": self._started_iso,
+            "completed_at": self._completed_iso,
+            "duration_seconds": self._duration,
             "retry_count": self.retry_count,
             "error_message": self.error_message,
         }
+
+    def to_json(self) -> str:
+        """
+        Serialize the job's dictionary representation to compact JSON.
+
+        Returns:
+            Job data as JSON text
+        """
+        return dumps_json(self.to_dict())
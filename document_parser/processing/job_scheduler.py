@@ -0,0 +1,175 @@
+"""
+Admission scheduler for document processing jobs.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+
+from document_parser.processing.job import Job
+
+
+class _Group:
+    """Waiting jobs of one scheduling group."""
+
+    __slots__ = ("weight", "deficit", "waiters")
+
+    def __init__(self, weight: int):
+        self.weight = weight
+        self.deficit = 0
+
+        # Heap of (effective_priority, sequence, enqueued_at, job, waiter);
+        # entries of cancelled waiters are skipped when popped
+        self.waiters: list[tuple[int, int, float, Job, asyncio.Future[None]]] = []
+
+
+class JobScheduler:
+    """
+    Admits jobs to a fixed number of processing slots.
+
+    Jobs that find every slot busy wait until one is released. Waiting jobs
+    are partitioned into groups (e.g. by source host) that share freed slots
+    in weighted deficit round-robin order, so a group of weight 3 is admitted
+    three times as often as a busy group of weight 1 and no single group can
+    monopolize processing. Within a group, lower ``Job.priority`` values are
+    admitted first, in FIFO order within a priority, and waiting jobs gain
+    one priority level per ``aging_interval`` seconds so low-priority work is
+    not starved.
+    """
+
+    def __init__(self, max_running: int = 3, aging_interval: float = 30.0):
+        """
+        Initialize job scheduler.
+
+        Args:
+            max_running: Maximum number of concurrently running jobs
+            aging_interval: Seconds a job waits to gain one priority level
+        """
+        self.max_running = max_running
+        self.aging_interval = aging_interval
+
+        # Groups with waiting jobs, in round-robin order
+        self._groups: dict[str, _Group] = {}
+        self._active: deque[str] = deque()
+        self._running = 0
+        self._waiting = 0
+        self._sequence = itertools.count()
+        self._last_aged = time.monotonic()
+        self._logger = logging.getLogger(__name__)
+
+    async def acquire(
+        self, job: Job, group_key: str = "default", weight: int = 1
+    ) -> None:
+        """
+        Wait for a processing slot for a job.
+
+        Every successful acquire must be paired with a release.
+
+        Args:
+            job: Job to admit
+            group_key: Scheduling group the job belongs to
+            weight: Share of freed slots the group gets relative to others
+        """
+        if weight < 1:
+            raise ValueError(f"weight must be at least 1: {weight!r}")
+
+        if self._running < self.max_running and not self._waiting:
+            self._running += 1
+            return
+
+        group = self._groups.get(group_key)
+        if group is None:
+            group = self._groups[group_key] = _Group(weight)
+            self._active.append(group_key)
+        else:
+            group.weight = weight
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            group.waiters,
+            (job.priority, next(self._sequence), time.monotonic(), job, waiter),
+        )
+        self._waiting += 1
+
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                self._waiting -= 1
+            else:
+                # The slot was handed over just before cancellation; pass it on
+                self.release()
+            raise
+
+        self._logger.debug("Job %s admitted after waiting", job.job_id)
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next waiting job if any."""
+        waiter = self._pop_next()
+        if waiter is None:
+            self._running -= 1
+            return
+
+        # The slot stays taken and passes straight to the waiter
+        self._waiting -= 1
+        waiter.set_result(None)
+
+    def _pop_next(self) -> asyncio.Future[None] | None:
+        """
+        Pop the waiter of the next job to admit.
+
+        Returns:
+            Waiter future, or None if no job is waiting
+        """
+        self._apply_aging()
+
+        while self._active:
+            group_key = self._active[0]
+            group = self._groups[group_key]
+
+            waiters = group.waiters
+            while waiters and waiters[0][4].done():
+                heapq.heappop(waiters)
+
+            if not waiters:
+                # Idle groups leave the rotation and forfeit their deficit
+                self._active.popleft()
+                del self._groups[group_key]
+                continue
+
+            # Every job costs one slot; a group's turn lasts `weight` jobs
+            if group.deficit < 1:
+                group.deficit += group.weight
+            group.deficit -= 1
+            if group.deficit < 1:
+                self._active.rotate(-1)
+
+            return heapq.heappop(waiters)[4]
+
+        return None
+
+    def _apply_aging(self) -> None:
+        """Recompute effective priorities once per aging interval."""
+        now = time.monotonic()
+        if now - self._last_aged < self.aging_interval:
+            return
+
+        # Waiting jobs are few, so rebuilding the heaps is cheap
+        for group in self._groups.values():
+            group.waiters = [
+                (
+                    job.priority - int((now - enqueued_at) / self.aging_interval),
+                    sequence,
+                    enqueued_at,
+                    job,
+                    waiter,
+                )
+                for _, sequence, enqueued_at, job, waiter in group.waiters
+                if not waiter.done()
+            ]
+            heapq.heapify(group.waiters)
+        self._last_aged = now
@@ -10,7 +10,7 @@ from document_parser.processing.job import Job
 
 class TaskQueue:
     """
-    Asynchronous task queue for managing document processing jobs.
+    Asynchronous FIFO task queue for managing document processing jobs.
     """
 
     def __init__(self, max_size: int = 3):
@@ -21,7 +21,7 @@ class TaskQueue:
             max_size: Maximum number of concurrent jobs
         """
         self.max_size = max_size
-        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=max_size)
         self._logger = logging.getLogger(__name__)
 
     async def enqueue(self, job: Job) -> bool:
@@ -37,17 +37,41 @@ class TaskQueue:
         try:
             # Try to add to queue without blocking
             self._queue.put_nowait(job)
-            job.mark_queued()
-            self._logger.info(f"Job {job.job_id} enqueued successfully")
-            return True
 
         except asyncio.QueueFull:
-            self._logger.warning(f"Queue full, cannot enqueue job {job.job_id}")
+            self._logger.warning("Queue full, cannot enqueue job %s", job.job_id)
             return False
 
+        job.mark_queued()
+        self._logger.info("Job %s enqueued successfully", job.job_id)
+        return True
+
+    async def enqueue_blocking(self, job: Job, timeout: float | None = None) -> bool:
+        """
+        Add a job to the queue, waiting for a free slot if it is full.
+
+        Args:
+            job: Job to enqueue
+            timeout: Maximum time to wait for a slot (seconds, None to wait
+                indefinitely)
+
+        Returns:
+            True if successfully queued, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._queue.put(job), timeout)
+
+        except asyncio.TimeoutError:
+            self._logger.warning("Timed out waiting to enqueue job %s", job.job_id)
+            return False
+
+        job.mark_queued()
+        self._logger.info("Job %s enqueued successfully", job.job_id)
+        return True
+
     async def dequeue(self, timeout: float | None = None) -> Job | None:
         """
-        Remove and return a job from the queue.
+        Remove and return the oldest job from the queue.
 
         Args:
             timeout: Maximum time to wait for a job (seconds)
@@ -56,18 +80,15 @@ class TaskQueue:
             Job if available, None if timeout
         """
         try:
-            if timeout:
-                job = await asyncio.wait_for(self._queue.get(), timeout=timeout)
-            else:
-                job = await self._queue.get()
-
-            job.mark_running()
-            self._logger.info(f"Job {job.job_id} dequeued for processing")
-            return job
+            job = await asyncio.wait_for(self._queue.get(), timeout or None)
 
         except asyncio.TimeoutError:
             return None
 
+        job.mark_running()
+        self._logger.info("Job %s dequeued for processing", job.job_id)
+        return job
+
     def is_full(self) -> bool:
         """
         Check if queue is full.
@@ -3,11 +3,21 @@ Task tracker for monitoring job status and history.
 """
 
 import logging
-from collections import OrderedDict
+from itertools import islice
+from typing import TypedDict
 
 from document_parser.processing.job import Job, JobStatus
 
 
+class StatsDict(TypedDict):
+    """Processing statistics returned by TaskTracker.get_statistics."""
+
+    total_jobs: int
+    active_jobs: int
+    status_counts: dict[str, int]
+    average_duration_seconds: float | None
+
+
 class TaskTracker:
     """
     Tracks status and history of processing jobs.
@@ -21,23 +31,68 @@ class TaskTracker:
             max_history: Maximum number of jobs to keep in history
         """
         self.max_history = max_history
-        self._jobs: dict[str, Job] = OrderedDict()
+        self._jobs: dict[str, Job] = {}
         self._active_jobs: dict[str, Job] = {}
         self._logger = logging.getLogger(__name__)
 
+        # Jobs indexed by current status, kept in sync via status callbacks
+        self._by_status: dict[JobStatus, dict[str, Job]] = {s: {} for s in JobStatus}
+        self._status_counts: dict[str, int] = {s.value: 0 for s in JobStatus}
+
+        # Running total of completed job durations, for the average
+        self._completed_durations: dict[str, float] = {}
+        self._completed_duration_sum = 0.0
+
     def register_job(self, job: Job) -> None:
         """
         Register a new job for tracking.
 
         Args:
             job: Job to register
+
+        Raises:
+            ValueError: If a job with the same ID is already tracked
         """
+        if job.job_id in self._jobs:
+            raise ValueError(f"Job already registered: {job.job_id}")
+
         self._jobs[job.job_id] = job
-        self._logger.debug(f"Registered job {job.job_id}")
+        self._index(job)
+        self._logger.debug("Registered job %s", job.job_id)
 
         # Cleanup old jobs if history limit exceeded
         self._cleanup_history()
 
+    def register_jobs(self, jobs: list[Job]) -> None:
+        """
+        Register several jobs at once, trimming the history a single time.
+
+        Args:
+            jobs: Jobs to register, oldest first
+
+        Raises:
+            ValueError: If any job ID is already tracked or repeated; no jobs
+                are registered in that case
+        """
+        # Validate the whole batch first so a failure leaves nothing behind
+        seen: set[str] = set()
+        duplicates = []
+        for job in jobs:
+            if job.job_id in self._jobs or job.job_id in seen:
+                duplicates.append(job.job_id)
+            seen.add(job.job_id)
+        if duplicates:
+            raise ValueError(f"Jobs already registered: {', '.join(duplicates)}")
+
+        for job in jobs:
+            self._jobs[job.job_id] = job
+            self._index(job)
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Registered %d jobs", len(jobs))
+
+        self._cleanup_history()
+
     def mark_active(self, job_id: str) -> None:
         """
         Mark a job as actively processing.
@@ -45,10 +100,11 @@ class TaskTracker:
         Args:
             job_id: Job identifier
         """
-        if job_id in self._jobs:
-            job = self._jobs[job_id]
+        job = self._jobs.get(job_id)
+        if job is not None:
             self._active_jobs[job_id] = job
-            self._logger.debug(f"Marked job {job_id} as active")
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Marked job %s as active", job_id)
 
     def mark_inactive(self, job_id: str) -> None:
         """
@@ -57,9 +113,9 @@ class TaskTracker:
         Args:
             job_id: Job identifier
         """
-        if job_id in self._active_jobs:
-            del self._active_jobs[job_id]
-            self._logger.debug(f"Marked job {job_id} as inactive")
+        if self._active_jobs.pop(job_id, None) is not None:
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Marked job %s as inactive", job_id)
 
     def get_job(self, job_id: str) -> Job | None:
         """
@@ -90,9 +146,9 @@ class TaskTracker:
             status: Job status to filter by
 
         Returns:
-            List of jobs with matching status
+            List of jobs with matching status, in the order they reached it
         """
-        return [job for job in self._jobs.values() if job.status == status]
+        return list(self._by_status[status].values())
 
     def get_recent_jobs(self, limit: int = 10) -> list[Job]:
         """
@@ -102,59 +158,111 @@ class TaskTracker:
             limit: Maximum number of jobs to return
 
         Returns:
-            List of recent jobs
+            List of recent jobs, oldest first
         """
-        jobs = list(self._jobs.values())
-        return jobs[-limit:]
+        # Walk back from the newest job instead of copying the whole history
+        jobs = list(islice(reversed(self._jobs.values()), limit))
+        jobs.reverse()
+        return jobs
 
-    def get_statistics(self) -> dict[str, any]:
+    def get_statistics(self) -> StatsDict:
         """
         Get processing statistics.
 
         Returns:
             Dictionary with statistics
         """
-        total_jobs = len(self._jobs)
-        status_counts = {}
-
-        for status in JobStatus:
-            count = len(self.get_jobs_by_status(status))
-            status_counts[status.value] = count
-
-        completed_jobs = [
-            job
-            for job in self._jobs.values()
-            if job.status == JobStatus.COMPLETED and job.get_duration_seconds()
-        ]
-
         avg_duration = None
-        if completed_jobs:
-            total_duration = sum(job.get_duration_seconds() for job in completed_jobs)
-            avg_duration = total_duration / len(completed_jobs)
+        if self._completed_durations:
+            avg_duration = self._completed_duration_sum / len(self._completed_durations)
 
         return {
-            "total_jobs": total_jobs,
+            "total_jobs": len(self._jobs),
             "active_jobs": len(self._active_jobs),
-            "status_counts": status_counts,
+            "status_counts": dict(self._status_counts),
             "average_duration_seconds": avg_duration,
         }
 
     def _cleanup_history(self) -> None:
-        """Remove old jobs to maintain history limit."""
+        """Remove the oldest jobs while the history limit is exceeded."""
+        # Single registrations evict at most one job; batches may evict more
         while len(self._jobs) > self.max_history:
-            # Remove oldest job (first item in OrderedDict)
+            # Remove oldest job (dicts keep insertion order)
             oldest_job_id = next(iter(self._jobs))
-            self._jobs.pop(oldest_job_id)
-            self._logger.debug(f"Removed old job {oldest_job_id} from history")
+            self._forget(oldest_job_id)
+            self._logger.debug("Removed old job %s from history", oldest_job_id)
 
     def clear_history(self) -> None:
         """Clear all job history except active jobs."""
-        active_job_ids = set(self._active_jobs.keys())
-        self._jobs = OrderedDict(
-            {
-                job_id: job
-                for job_id, job in self._jobs.items()
-                if job_id in active_job_ids
-            }
-        )
+        for job_id in list(self._jobs):
+            if job_id not in self._active_jobs:
+                self._forget(job_id)
         self._logger.info("Cleared job history")
+
+    def _forget(self, job_id: str) -> None:
+        """
+        Drop a job from the history and every index that references it.
+
+        Args:
+            job_id: Identifier of a tracked job
+        """
+        self._unindex(self._jobs.pop(job_id))
+
+    def _index(self, job: Job) -> None:
+        """
+        Add a job to the status index and duration totals.
+
+        Args:
+            job: Registered job
+        """
+        self._by_status[job.status][job.job_id] = job
+        self._status_counts[job.status.value] += 1
+        self._add_duration(job)
+        job._on_status_change = self._handle_status_change
+
+    def _unindex(self, job: Job) -> None:
+        """
+        Remove a job from the status index and duration totals.
+
+        Args:
+            job: Job leaving the history
+        """
+        job._on_status_change = None
+        del self._by_status[job.status][job.job_id]
+        self._status_counts[job.status.value] -= 1
+        self._remove_duration(job.job_id)
+
+    def _handle_status_change(self, job: Job, previous: JobStatus) -> None:
+        """
+        Move a job between status buckets after a status change.
+
+        Args:
+            job: Job whose status changed
+            previous: Status before the change
+        """
+        del self._by_status[previous][job.job_id]
+        self._by_status[job.status][job.job_id] = job
+        self._status_counts[previous.value] -= 1
+        self._status_counts[job.status.value] += 1
+
+        self._remove_duration(job.job_id)
+        self._add_duration(job)
+
+    def _add_duration(self, job: Job) -> None:
+        """Count a completed job's duration towards the average."""
+        if job.status != JobStatus.COMPLETED:
+            return
+
+        duration = job.get_duration_seconds()
+        if duration:
+            self._completed_durations[job.job_id] = duration
+            self._completed_duration_sum += duration
+
+    def _remove_duration(self, job_id: str) -> None:
+        """Stop counting a job's duration towards the average."""
+        duration = self._completed_durations.pop(job_id, None)
+        if duration is not None:
+            self._completed_duration_sum -= duration
+            if not self._completed_durations:
+                # Avoid carrying floating-point drift into the next average
+                self._completed_duration_sum = 0.0
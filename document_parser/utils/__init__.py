@@ -4,13 +4,19 @@ Utility functions for document parser.
 
 from document_parser.utils.file_utils import (
     cleanup_old_files,
+    cleanup_old_files_async,
     detect_document_type,
     get_file_extension,
     sanitize_filename,
+    sanitize_filenames,
 )
+from document_parser.utils.json_utils import dumps_json
 from document_parser.utils.logging_utils import (
     get_logger,
+    get_worker_log_queue,
     setup_logging,
+    setup_worker_logging,
+    stop_logging,
 )
 from document_parser.utils.network_utils import (
     extract_filename_from_url,
@@ -24,14 +30,20 @@ from document_parser.utils.system_utils import (
 
 __all__ = [
     "sanitize_filename",
+    "sanitize_filenames",
     "get_file_extension",
     "detect_document_type",
     "cleanup_old_files",
+    "cleanup_old_files_async",
     "is_valid_url",
     "extract_filename_from_url",
     "setup_logging",
+    "stop_logging",
+    "setup_worker_logging",
+    "get_worker_log_queue",
     "get_logger",
     "get_available_memory",
     "is_mlx_available",
     "generate_unique_id",
+    "dumps_json",
 ]
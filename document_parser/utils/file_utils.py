@@ -2,10 +2,95 @@
 File-related utility functions.
 """
 
-import re
+import asyncio
+import os
 import time
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+from document_parser.utils.network_utils import is_valid_url
+
+# Characters that are unsafe in filenames on common filesystems
+_UNSAFE_CHARS = '<>:"/\\|?*\0'
+
+# Maps unsafe characters to "_". A string indexed by code point is the
+# fastest str.translate table; characters past its end (non-ASCII) raise
+# IndexError and are left unchanged
+_SANITIZE_TABLE = "".join(
+    "_" if chr(i) in _UNSAFE_CHARS else chr(i) for i in range(128)
+)
+
+# Joins names for batch sanitization; left alone by the table
+_BATCH_SEPARATOR = "\n"
+
+# Maximum sanitized filename length
+_MAX_FILENAME_LENGTH = 200
+
+# Extension to type mapping
+_TYPE_MAPPING: dict[str, str] = {
+    ".pdf": "pdf",
+    ".docx": "office_document",
+    ".xlsx": "office_document",
+    ".pptx": "office_document",
+    ".html": "web_document",
+    ".htm": "web_document",
+    ".xhtml": "web_document",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".csv": "spreadsheet",
+    ".png": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".tiff": "image",
+    ".tif": "image",
+    ".bmp": "image",
+    ".webp": "image",
+    ".mp3": "audio",
+    ".wav": "audio",
+    ".m4a": "audio",
+    ".flac": "audio",
+    ".xml": "structured_data",
+    ".json": "structured_data",
+}
+
+# Pipeline suggestions based on type
+_PIPELINE_MAPPING: dict[str, str] = {
+    "pdf": "standard",
+    "office_document": "standard",
+    "web_document": "standard",
+    "markdown": "standard",
+    "spreadsheet": "standard",
+    "image": "vlm",  # Images benefit from vision models
+    "audio": "asr",  # Audio requires speech recognition
+    "structured_data": "standard",
+}
+
+# Shared (document_type, suggested_pipeline) results, one per type
+_DETECTION_RESULTS: dict[str, tuple[str, str]] = {
+    doc_type: (doc_type, pipeline) for doc_type, pipeline in _PIPELINE_MAPPING.items()
+}
+_UNKNOWN_RESULT = ("unknown", "standard")
+
+# Extension to detection result, so detection is one lookup
+_EXTENSION_TYPES: dict[str, tuple[str, str]] = {
+    ext: _DETECTION_RESULTS[doc_type] for ext, doc_type in _TYPE_MAPPING.items()
+}
+
+# Leading bytes read when sniffing a file's type from its content
+_SNIFF_SIZE = 16
+
+# Byte signatures checked when the extension doesn't identify a document
+_MAGIC_PREFIXES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "pdf"),
+    (b"PK\x03\x04", "office_document"),
+    (b"\xff\xd8\xff", "image"),
+    (b"\x89PNG", "image"),
+    (b"II*\x00", "image"),
+    (b"MM\x00*", "image"),
+    (b"ID3", "audio"),
+    (b"fLaC", "audio"),
+)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -19,17 +104,59 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove or replace problematic characters
-    safe = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    return _truncate_filename(filename.translate(_SANITIZE_TABLE))
 
+
+def sanitize_filenames(filenames: list[str]) -> list[str]:
+    """
+    Sanitize a batch of filenames, e.g. when ingesting a directory.
+
+    The names are translated as one joined string, so the per-name call
+    overhead is paid once for the whole batch.
+
+    Args:
+        filenames: Original filenames
+
+    Returns:
+        Sanitized filenames, in the same order
+    """
+    joined = _BATCH_SEPARATOR.join(filenames)
+    if joined.count(_BATCH_SEPARATOR) != len(filenames) - 1:
+        # A name contains the separator; sanitize one by one
+        return [sanitize_filename(name) for name in filenames]
+
+    safe_names = joined.translate(_SANITIZE_TABLE).split(_BATCH_SEPARATOR)
+    if max(map(len, safe_names)) <= _MAX_FILENAME_LENGTH:
+        return safe_names
+
+    return [_truncate_filename(name) for name in safe_names]
+
+
+def _truncate_filename(safe: str) -> str:
+    """
+    Limit a sanitized filename's length, keeping its extension.
+
+    Args:
+        safe: Sanitized filename
+
+    Returns:
+        Filename of at most the maximum length
+    """
     # Limit length to avoid filesystem issues
-    max_length = 200
-    if len(safe) > max_length:
-        name_part, ext_part = Path(safe).stem, Path(safe).suffix
-        safe = name_part[: max_length - len(ext_part)] + ext_part
+    if len(safe) <= _MAX_FILENAME_LENGTH:
+        return safe
+
+    # Keep the extension (a dot after the first character, like Path.suffix)
+    dot = safe.rfind(".")
+    if dot > 0 and dot != len(safe) - 1:
+        name_part, ext_part = safe[:dot], safe[dot:]
+    else:
+        name_part, ext_part = safe, ""
 
-    return safe
+    return name_part[: _MAX_FILENAME_LENGTH - len(ext_part)] + ext_part
 
 
+@lru_cache(maxsize=1024)
 def get_file_extension(file_path: str) -> str:
     """
     Extract file extension from path or URL.
@@ -40,15 +167,11 @@ def get_file_extension(file_path: str) -> str:
     Returns:
         Lowercase file extension with dot (e.g., '.pdf')
     """
-    from document_parser.utils.network_utils import is_valid_url
+    path = urlsplit(file_path).path if is_valid_url(file_path) else file_path
 
-    if is_valid_url(file_path):
-        parsed = urlparse(file_path)
-        path = parsed.path
-    else:
-        path = file_path
-
-    return Path(path).suffix.lower()
+    # splitext avoids building a Path; a bare trailing dot is not a suffix
+    ext = os.path.splitext(path)[1]
+    return "" if ext == "." else ext.lower()
 
 
 def detect_document_type(source: str) -> tuple[str, str]:
@@ -63,49 +186,46 @@ def detect_document_type(source: str) -> tuple[str, str]:
     """
     extension = get_file_extension(source)
 
-    # Extension to type mapping
-    type_mapping = {
-        ".pdf": "pdf",
-        ".docx": "office_document",
-        ".xlsx": "office_document",
-        ".pptx": "office_document",
-        ".html": "web_document",
-        ".htm": "web_document",
-        ".xhtml": "web_document",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".csv": "spreadsheet",
-        ".png": "image",
-        ".jpg": "image",
-        ".jpeg": "image",
-        ".tiff": "image",
-        ".tif": "image",
-        ".bmp": "image",
-        ".webp": "image",
-        ".mp3": "audio",
-        ".wav": "audio",
-        ".m4a": "audio",
-        ".flac": "audio",
-        ".xml": "structured_data",
-        ".json": "structured_data",
-    }
-
-    # Pipeline suggestions based on type
-    pipeline_mapping = {
-        "pdf": "standard",
-        "office_document": "standard",
-        "web_document": "standard",
-        "markdown": "standard",
-        "spreadsheet": "standard",
-        "image": "vlm",  # Images benefit from vision models
-        "audio": "asr",  # Audio requires speech recognition
-        "structured_data": "standard",
-    }
-
-    doc_type = type_mapping.get(extension, "unknown")
-    suggested_pipeline = pipeline_mapping.get(doc_type, "standard")
-
-    return doc_type, suggested_pipeline
+    detected = _EXTENSION_TYPES.get(extension)
+    if detected is not None:
+        return detected
+
+    # Unknown or missing extension; fall back to the file header
+    doc_type = _sniff_by_prefix(source)
+    if doc_type is None:
+        return _UNKNOWN_RESULT
+    return _DETECTION_RESULTS[doc_type]
+
+
+def _sniff_by_prefix(path: str) -> str | None:
+    """
+    Detect document type from the leading bytes of a local file.
+
+    Args:
+        path: Local file path
+
+    Returns:
+        Document type, or None if the file is unreadable or not recognized
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_SNIFF_SIZE)
+    except OSError:
+        return None
+
+    for prefix, doc_type in _MAGIC_PREFIXES:
+        if head.startswith(prefix):
+            return doc_type
+
+    # RIFF is a container; the form type tells WAV audio from WebP images
+    if head.startswith(b"RIFF"):
+        form = head[8:12]
+        if form == b"WAVE":
+            return "audio"
+        if form == b"WEBP":
+            return "image"
+
+    return None
 
 
 def cleanup_old_files(directory: str, max_age_hours: int = 24) -> int:
@@ -119,42 +239,60 @@ def cleanup_old_files(directory: str, max_age_hours: int = 24) -> int:
     Returns:
         Number of files removed
     """
-    dir_path = Path(directory)
-    if not dir_path.exists():
-        return 0
-
-    max_age_seconds = max_age_hours * 3600
-    current_time = time.time()
+    cutoff = time.time() - max_age_hours * 3600
     removed_count = 0
 
-    for item in dir_path.iterdir():
-        try:
-            if item.is_file():
-                file_age = current_time - item.stat().st_mtime
-                if file_age > max_age_seconds:
-                    item.unlink()
-                    removed_count += 1
-            elif item.is_dir():
-                # Remove empty directories
-                try:
-                    if not any(item.iterdir()):
-                        item.rmdir()
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # Missing or unreadable directory
+        return 0
+
+    # scandir entries carry type (and on some platforms stat) information
+    # from the directory read, saving a syscall per entry
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    # Remove empty directories
+                    try:
+                        os.rmdir(entry.path)
                         removed_count += 1
-                except OSError:
-                    pass
-        except Exception:
-            # Skip files that can't be accessed
-            continue
+                    except OSError:
+                        pass
+            except Exception:
+                # Skip files that can't be accessed
+                continue
 
     return removed_count
 
 
-def ensure_directory(path: str) -> Path:
+async def cleanup_old_files_async(directory: str, max_age_hours: int = 24) -> int:
+    """
+    Remove old files from a directory without blocking the event loop.
+
+    Runs cleanup_old_files in a worker thread.
+
+    Args:
+        directory: Directory path to clean
+        max_age_hours: Maximum file age in hours
+
+    Returns:
+        Number of files removed
+    """
+    return await asyncio.to_thread(cleanup_old_files, directory, max_age_hours)
+
+
+def ensure_directory(path: str | os.PathLike[str]) -> Path:
     """
     Ensure a directory exists, creating it if necessary.
 
     Args:
-        path: Directory path
+        path: Directory path (string or path-like)
 
     Returns:
         Path object for the directory
@@ -0,0 +1,35 @@
+"""
+JSON serialization helpers.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps_json(data: Any) -> str:
+        """
+        Serialize data to compact JSON using orjson.
+
+        Args:
+            data: JSON-compatible data
+
+        Returns:
+            JSON text
+        """
+        return orjson.dumps(data).decode()
+
+except ImportError:
+
+    def dumps_json(data: Any) -> str:
+        """
+        Serialize data to compact JSON using the standard library.
+
+        Args:
+            data: JSON-compatible data
+
+        Returns:
+            JSON text
+        """
+        return json.dumps(data, separators=(",", ":"))
@@ -2,12 +2,25 @@
 Logging configuration utilities.
 """
 
+import atexit
 import logging
 import logging.handlers
+import multiprocessing
+import queue
+from multiprocessing.queues import Queue
 from pathlib import Path
 
 from document_parser.config.models import LoggingSettings
 
+# Background listener writing queued log records to the real handlers
+_queue_listener: logging.handlers.QueueListener | None = None
+
+# Queue worker processes log to, and the listener forwarding its records.
+# The queue lives as long as this process, so workers still starting up
+# during shutdown can always attach to it.
+_worker_log_queue: "Queue[logging.LogRecord] | None" = None
+_worker_log_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging(settings: LoggingSettings) -> None:
     """
@@ -25,8 +38,10 @@ def setup_logging(settings: LoggingSettings) -> None:
     root_logger.setLevel(getattr(logging, settings.level))
 
     # Clear existing handlers
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
 
     # Create formatters
     if settings.enable_json_logs:
@@ -46,7 +61,6 @@ def setup_logging(settings: LoggingSettings) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, settings.level))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -56,7 +70,113 @@ def setup_logging(settings: LoggingSettings) -> None:
     )
     file_handler.setLevel(getattr(logging, settings.level))
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    # Loggers only enqueue records; a background thread does the console and
+    # file writes (and rotation) so logging never blocks the event loop
+    global _queue_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Stop the background log writers, flushing records still queued.
+
+    Called automatically at interpreter exit.
+    """
+    global _worker_log_listener
+
+    if _worker_log_listener is not None:
+        _close_listener(_worker_log_listener)
+        _worker_log_listener = None
+
+    _stop_queue_listener()
+
+
+def _stop_queue_listener() -> None:
+    """Stop the listener writing this process's log records."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _close_listener(_queue_listener)
+        _queue_listener = None
+
+
+def _close_listener(listener: logging.handlers.QueueListener) -> None:
+    """
+    Stop a queue listener and close its handlers.
+
+    Args:
+        listener: Running queue listener
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hand records received from worker processes to local loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Dispatch a record as if it had been logged in this process.
+
+        Args:
+            record: Log record from a worker process
+        """
+        logging.getLogger(record.name).handle(record)
+
+
+def get_worker_log_queue() -> "Queue[logging.LogRecord]":
+    """
+    Get the queue spawned worker processes log to (see setup_worker_logging).
+
+    Records put on it are handed to this process's handlers by a background
+    listener, started on first use and stopped by stop_logging.
+
+    Returns:
+        Worker log queue
+    """
+    global _worker_log_queue, _worker_log_listener
+
+    if _worker_log_queue is None:
+        _worker_log_queue = multiprocessing.get_context("spawn").Queue()
+
+    if _worker_log_listener is None:
+        _worker_log_listener = logging.handlers.QueueListener(
+            _worker_log_queue, _ForwardingHandler()
+        )
+        _worker_log_listener.start()
+
+    return _worker_log_queue
+
+
+def setup_worker_logging(log_queue: "Queue[logging.LogRecord]", level: str) -> None:
+    """
+    Configure logging in a worker process to send records to the parent.
+
+    Workers never open the log file themselves, so only the parent process
+    writes and rotates it.
+
+    Args:
+        log_queue: Queue from the parent's get_worker_log_queue
+        level: Log level name
+    """
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, level))
+
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -2,23 +2,85 @@
 Network-related utility functions.
 """
 
-from pathlib import Path
-from urllib.parse import urlparse
+from collections.abc import Collection
+from functools import lru_cache
+from string import ascii_letters, digits
+from urllib.parse import SplitResult, urlsplit
 
+# Characters allowed in a URL scheme after its leading letter (RFC 3986)
+_SCHEME_CHARS = frozenset(ascii_letters + digits + "+-.")
 
-def is_valid_url(source: str) -> bool:
+
+@lru_cache(maxsize=4096)
+def _parse(url: str) -> SplitResult:
+    """
+    Split a URL into components, caching the result.
+
+    Validation, filename extraction and scheme checks usually run on the
+    same URL, so they share one parse.
+
+    Args:
+        url: URL string
+
+    Returns:
+        Split URL components
+    """
+    return urlsplit(url)
+
+
+def _scheme_end(url: str) -> int:
+    """
+    Find the "://" that ends a well-formed URL scheme.
+
+    Args:
+        url: String to check
+
+    Returns:
+        Index of "://", or -1 if the string doesn't start with a scheme
+    """
+    sep = url.find("://")
+    if sep <= 0 or url[0] not in ascii_letters:
+        return -1
+    if not _SCHEME_CHARS.issuperset(url[1:sep]):
+        return -1
+    return sep
+
+
+def is_valid_url(source: object) -> bool:
     """
     Check if a string is a valid URL.
 
+    Args:
+        source: Value to check; anything other than a string is not a URL
+
+    Returns:
+        True if valid URL, False otherwise
+    """
+    if not isinstance(source, str):
+        return False
+
+    return _is_valid_url_str(source)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_url_str(source: str) -> bool:
+    """
+    Check if a string is a valid URL, caching the result.
+
     Args:
         source: String to check
 
     Returns:
         True if valid URL, False otherwise
     """
+    # A URL needs a scheme before "://" and a netloc after it; checking the
+    # scheme's characters rejects local paths without parsing them
+    if _scheme_end(source) == -1:
+        return False
+
     try:
-        result = urlparse(source)
-        return all([result.scheme, result.netloc])
+        result = _parse(source)
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
@@ -33,32 +95,39 @@ def extract_filename_from_url(url: str) -> str | None:
     Returns:
         Filename if found, None otherwise
     """
-    try:
-        parsed = urlparse(url)
-        path = Path(parsed.path)
-        filename = path.name
+    # The filename is the last path segment, which ends at the query or
+    # fragment; slicing the string avoids parsing the whole URL
+    end = len(url)
+    for sep in "?#":
+        i = url.find(sep, 0, end)
+        if i != -1:
+            end = i
 
-        if filename:
-            return filename
+    start = url.find("://", 0, end)
+    if start != -1:
+        # Skip the netloc; a URL without a path has no filename
+        start = url.find("/", start + 3, end)
+        if start == -1:
+            return None
+    else:
+        start = 0
 
-        return None
-    except Exception:
-        return None
+    return url[url.rfind("/", start, end) + 1 : end] or None
 
 
-def validate_url_scheme(url: str, allowed_schemes: list[str]) -> bool:
+def validate_url_scheme(url: str, allowed_schemes: Collection[str]) -> bool:
     """
     Validate that URL uses an allowed scheme.
 
     Args:
         url: URL to validate
-        allowed_schemes: List of allowed schemes (e.g., ['http', 'https'])
+        allowed_schemes: Allowed schemes (e.g., ['http', 'https']); pass a
+            frozenset when validating many URLs against the same schemes
 
     Returns:
         True if scheme is allowed, False otherwise
     """
     try:
-        parsed = urlparse(url)
-        return parsed.scheme in allowed_schemes
+        return _parse(url).scheme in allowed_schemes
     except Exception:
         return False
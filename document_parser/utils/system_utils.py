@@ -2,8 +2,50 @@
 System-related utility functions.
 """
 
+import base64
 import importlib.util
-import uuid
+import itertools
+import os
+import platform
+import secrets
+import sys
+from collections.abc import Iterator
+from functools import cache
+
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+# IDs are 40 bits: a random 32-bit block prefix plus an 8-bit sequence
+# number. A new prefix is drawn every 256 IDs, so each ID carries 32 bits of
+# system entropy while the entropy source is only read once per block.
+_ID_SEQUENCE_BITS = 8
+_ID_SEQUENCE_MASK = (1 << _ID_SEQUENCE_BITS) - 1
+
+# Current (prefix, sequence counter) block, replaced as a whole so callers
+# never mix the prefix of one block with the sequence of another
+_id_block: tuple[int, Iterator[int]] = (0, itertools.count())
+
+
+def _reset_id_sequence() -> None:
+    """Start a new random ID block for the current process."""
+    global _id_block
+
+    # The new prefix must differ from the current one; a forked child would
+    # otherwise reproduce its parent's IDs whenever the draws matched
+    id_prefix = _id_block[0]
+    while id_prefix == _id_block[0]:
+        id_prefix = secrets.randbits(32) << _ID_SEQUENCE_BITS
+
+    _id_block = (id_prefix, itertools.count())
+
+
+_reset_id_sequence()
+
+# A forked child would otherwise continue the parent's ID stream
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_sequence)
 
 
 def get_available_memory() -> float:
@@ -13,19 +55,17 @@ def get_available_memory() -> float:
     Returns:
         Available memory in GB
     """
-    try:
-        import psutil
-
-        memory = psutil.virtual_memory()
-        return memory.available / (1024**3)
-    except ImportError:
+    if _psutil is None:
         # Return conservative estimate if psutil not available
         return 4.0
 
+    return float(_psutil.virtual_memory().available) / (1024**3)
 
+
+@cache
 def is_mlx_available() -> bool:
     """
-    Check if MLX is available on the system.
+    Check if MLX is available on the system (checked once per process).
 
     Returns:
         True if MLX is available, False otherwise
@@ -43,7 +83,17 @@ def generate_unique_id(prefix: str | None = None) -> str:
     Returns:
         Unique identifier string
     """
-    unique_id = str(uuid.uuid4())[:8]
+    id_prefix, counter = _id_block
+    sequence = next(counter)
+    while sequence > _ID_SEQUENCE_MASK:
+        # Block used up; move on to a fresh random prefix
+        if _id_block[1] is counter:
+            _reset_id_sequence()
+        id_prefix, counter = _id_block
+        sequence = next(counter)
+
+    value = id_prefix | sequence
+    unique_id = base64.b32encode(value.to_bytes(5, "big")).decode().lower()
 
     if prefix:
         return f"{prefix}_{unique_id}"
@@ -58,15 +108,23 @@ def get_system_info() -> dict:
     Returns:
         Dictionary with system information
     """
-    import platform
-    import sys
+    return {
+        **_static_system_info(),
+        "available_memory_gb": get_available_memory(),
+    }
+
+
+@cache
+def _static_system_info() -> dict:
+    """
+    Get the system information that can't change while the process runs.
 
-    info = {
+    Returns:
+        Dictionary with static system information (shared, do not modify)
+    """
+    return {
         "python_version": sys.version,
         "platform": platform.platform(),
         "processor": platform.processor(),
         "mlx_available": is_mlx_available(),
-        "available_memory_gb": get_available_memory(),
     }
-
-    return info
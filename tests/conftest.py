@@ -11,10 +11,10 @@ from document_parser.config.settings import reset_settings
 @pytest.fixture
 def test_settings():
     """Provide test application settings."""
-    settings = ApplicationSettings()
-    settings.storage.temp_directory = "./test_temp"
-    settings.logging.level = "DEBUG"
-    return settings
+    return ApplicationSettings(
+        storage={"temp_directory": "./test_temp"},
+        logging={"level": "DEBUG"},
+    )
 
 
 @pytest.fixture
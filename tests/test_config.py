@@ -30,6 +30,9 @@ class TestConfigurationModels:
             settings = LoggingSettings(level=level)
             assert settings.level == level
 
+        # Levels are case-insensitive
+        assert LoggingSettings(level="debug").level == "DEBUG"
+
         # Invalid level should raise error
         with pytest.raises(ValueError):
             LoggingSettings(level="INVALID")
@@ -56,6 +59,27 @@ class TestConfigurationModels:
         with pytest.raises(ValueError):
             PDFSettings(table_accuracy_mode="invalid")
 
+    def test_scheduling_weights_validation(self):
+        """Test scheduling weights must be positive."""
+        from document_parser.config.models import ServerSettings
+
+        settings = ServerSettings(scheduling_weights={"example.com": 3})
+        assert settings.scheduling_weights == {"example.com": 3}
+
+        with pytest.raises(ValueError):
+            ServerSettings(scheduling_weights={"example.com": 0})
+
+    def test_settings_are_frozen(self):
+        """Test settings cannot be mutated after creation."""
+        settings = ApplicationSettings()
+
+        with pytest.raises(ValueError):
+            settings.logging.level = "DEBUG"
+
+        updated = settings.logging.model_copy(update={"level": "DEBUG"})
+        assert updated.level == "DEBUG"
+        assert settings.logging.level == "INFO"
+
 
 class TestConfigurationLoading:
     """Test configuration loading."""
@@ -65,6 +89,73 @@ class TestConfigurationLoading:
         settings = load_settings("nonexistent.yaml")
         assert isinstance(settings, ApplicationSettings)
 
+    def test_load_settings_uses_cache(self, tmp_path, monkeypatch):
+        """Test parsed settings are cached and invalidated on config change."""
+        import os
+
+        from document_parser.config import settings as settings_module
+
+        monkeypatch.delenv("DOCUMENT_PARSER_CACHE_DIR", raising=False)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server:\n  max_concurrent_jobs: 5\n")
+        cache_dir = tmp_path / "cache"
+
+        # Caching is opt-in
+        load_settings(str(config_file))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.yaml"]
+
+        settings = load_settings(str(config_file), cache_dir=str(cache_dir))
+        assert settings.server.max_concurrent_jobs == 5
+        assert len(list(cache_dir.iterdir())) == 1
+
+        # A cache hit never parses the YAML
+        parses = []
+        real_load = settings_module.yaml.load
+        monkeypatch.setattr(
+            settings_module.yaml,
+            "load",
+            lambda *args, **kwargs: parses.append(1) or real_load(*args, **kwargs),
+        )
+
+        cached = load_settings(str(config_file), cache_dir=str(cache_dir))
+        assert cached.server.max_concurrent_jobs == 5
+        assert not parses
+
+        # Changing the config file invalidates the cache
+        config_file.write_text("server:\n  max_concurrent_jobs: 7\n")
+        mtime = config_file.stat().st_mtime + 10
+        os.utime(config_file, (mtime, mtime))
+
+        settings = load_settings(str(config_file), cache_dir=str(cache_dir))
+        assert settings.server.max_concurrent_jobs == 7
+        assert parses == [1]
+
+    def test_load_settings_cache_fingerprint(self, tmp_path):
+        """Test the cache is ignored for same-mtime edits or another version."""
+        import json
+        import os
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server:\n  max_concurrent_jobs: 5\n")
+        cache_dir = tmp_path / "cache"
+        load_settings(str(config_file), cache_dir=str(cache_dir))
+        stat = config_file.stat()
+
+        # Same mtime, different size
+        config_file.write_text("server:\n  max_concurrent_jobs: 10\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        settings = load_settings(str(config_file), cache_dir=str(cache_dir))
+        assert settings.server.max_concurrent_jobs == 10
+
+        # Cache written by another package version
+        (cache_file,) = cache_dir.iterdir()
+        cached = json.loads(cache_file.read_text())
+        cached["fingerprint"][2] = "0.0.0"
+        cached["settings"]["server"]["max_concurrent_jobs"] = 1
+        cache_file.write_text(json.dumps(cached))
+        settings = load_settings(str(config_file), cache_dir=str(cache_dir))
+        assert settings.server.max_concurrent_jobs == 10
+
     def test_settings_singleton(self):
         """Test settings singleton behavior."""
         from document_parser.config.settings import get_settings, reset_settings
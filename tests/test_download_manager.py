@@ -0,0 +1,70 @@
+"""
+Tests for the download manager.
+"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from document_parser.config.models import StorageSettings
+from document_parser.engine.download_manager import DownloadManager, _filename_for_url
+
+
+class TestFilenameForUrl:
+    """Test local filename derivation for URLs."""
+
+    def test_plain_path(self):
+        """Test the last path segment is used as is."""
+        assert _filename_for_url("https://ex.com/docs/report.pdf") == "report.pdf"
+
+    def test_query_and_fragment_are_ignored(self):
+        """Test slashes in the query or fragment don't pick the filename."""
+        assert _filename_for_url("https://ex.com/view?next=/img/photo.png") == "view"
+        assert _filename_for_url("https://ex.com/a.pdf#/x.wav") == "a.pdf"
+        assert _filename_for_url("https://ex.com/a.pdf?x=1#frag") == "a.pdf"
+
+    def test_missing_or_unsafe_name(self):
+        """Test fallback and sanitized names."""
+        assert _filename_for_url("https://ex.com/") == "downloaded_file"
+        assert _filename_for_url("https://ex.com") == "downloaded_file"
+        assert _filename_for_url("https://ex.com/a:b.pdf") == "a_b.pdf"
+
+
+class TestDownloadManager:
+    """Test downloading remote documents."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_with_same_basename(self, tmp_path):
+        """Test same-named URLs download to separate files."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            # Let the other download start before this one finishes
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        manager = DownloadManager(StorageSettings(temp_directory=str(tmp_path)))
+        await manager.aclose()
+        manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        try:
+            path_a, path_b = await asyncio.gather(
+                manager.download_file("https://ex.com/a/report.pdf"),
+                manager.download_file("https://ex.com/b/report.pdf"),
+            )
+
+            assert path_a != path_b
+            assert path_a.endswith("report.pdf")
+            with open(path_a, "rb") as f:
+                assert f.read() == b"/a/report.pdf"
+            with open(path_b, "rb") as f:
+                assert f.read() == b"/b/report.pdf"
+
+            # Cleaning up one download leaves the other in place
+            await manager.cleanup_file(path_a)
+            assert not os.path.exists(path_a)
+            with open(path_b, "rb") as f:
+                assert f.read() == b"/b/report.pdf"
+        finally:
+            await manager.aclose()
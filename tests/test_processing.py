@@ -2,9 +2,27 @@
 Tests for processing components.
 """
 
+import asyncio
+import json
+import sys
+import types
 from datetime import datetime
 
-from document_parser.processing.job import Job, JobStatus, ProcessingPipeline
+import pytest
+
+from document_parser.config.models import ApplicationSettings, ProcessingSettings
+from document_parser.engine.pipeline_factory import PipelineFactory
+from document_parser.engine.processor import ConverterCache
+from document_parser.engine.result_spool import spool_markdown
+from document_parser.mcp.handlers import ToolHandlers
+from document_parser.processing.job import (
+    Job,
+    JobStatus,
+    ProcessingPipeline,
+    parse_pipeline,
+)
+from document_parser.processing.job_scheduler import JobScheduler
+from document_parser.processing.task_queue import TaskQueue
 from document_parser.processing.task_tracker import TaskTracker
 
 
@@ -41,6 +59,7 @@ class TestJob:
         assert job.status == JobStatus.COMPLETED
         assert job.result_data == "Result content"
         assert job.completed_at is not None
+        assert job.get_duration_seconds() >= 0
 
     def test_job_failure(self):
         """Test job failure handling."""
@@ -70,6 +89,27 @@ class TestJob:
         assert job_dict["job_id"] == "test-123"
         assert job_dict["pipeline"] == "standard"
         assert job_dict["status"] == "pending"
+        assert job_dict["started_at"] is None
+        assert job_dict["completed_at"] is None
+
+        job.mark_running()
+        job_dict = job.to_dict()
+        assert job_dict["status"] == "running"
+        assert job_dict["started_at"] == job.started_at.isoformat()
+
+        job.mark_completed()
+        assert job.to_dict()["completed_at"] == job.completed_at.isoformat()
+        assert json.loads(job.to_json()) == job.to_dict()
+
+    def test_parse_pipeline(self):
+        """Test pipeline name parsing."""
+        assert parse_pipeline("VLM") == ProcessingPipeline.VLM
+        assert parse_pipeline("unknown") == ProcessingPipeline.STANDARD
+        assert parse_pipeline(None) == ProcessingPipeline.STANDARD
+        assert (
+            parse_pipeline("unknown", ProcessingPipeline.AUTO)
+            == ProcessingPipeline.AUTO
+        )
 
 
 class TestTaskTracker:
@@ -95,6 +135,54 @@ class TestTaskTracker:
         assert retrieved is not None
         assert retrieved.job_id == "test-123"
 
+        with pytest.raises(ValueError):
+            tracker.register_job(job)
+
+    def test_history_limit(self):
+        """Test the oldest jobs are evicted past max_history."""
+        tracker = TaskTracker(max_history=2)
+        for i in range(3):
+            tracker.register_job(
+                Job(
+                    job_id=f"job-{i}",
+                    source_path="document.pdf",
+                    pipeline=ProcessingPipeline.STANDARD,
+                )
+            )
+
+        assert tracker.get_job("job-0") is None
+        assert [job.job_id for job in tracker.get_recent_jobs()] == ["job-1", "job-2"]
+        assert tracker.get_statistics()["status_counts"]["pending"] == 2
+
+    def test_register_jobs(self):
+        """Test batch registration trims history and rejects duplicates."""
+        tracker = TaskTracker(max_history=3)
+        jobs = [
+            Job(
+                job_id=f"job-{i}",
+                source_path="document.pdf",
+                pipeline=ProcessingPipeline.STANDARD,
+            )
+            for i in range(5)
+        ]
+
+        tracker.register_jobs(jobs)
+        assert [job.job_id for job in tracker.get_recent_jobs()] == [
+            "job-2",
+            "job-3",
+            "job-4",
+        ]
+        assert tracker.get_statistics()["status_counts"]["pending"] == 3
+
+        new_job = Job(
+            job_id="job-5",
+            source_path="document.pdf",
+            pipeline=ProcessingPipeline.STANDARD,
+        )
+        with pytest.raises(ValueError):
+            tracker.register_jobs([new_job, jobs[4]])
+        assert tracker.get_job("job-5") is None
+
     def test_active_job_tracking(self):
         """Test active job tracking."""
         tracker = TaskTracker()
@@ -142,6 +230,25 @@ class TestTaskTracker:
         assert len(running_jobs) == 1
         assert len(completed_jobs) == 1
 
+    def test_status_index_follows_transitions(self):
+        """Test status queries reflect changes made after registration."""
+        tracker = TaskTracker()
+        job = Job(
+            job_id="test-123",
+            source_path="document.pdf",
+            pipeline=ProcessingPipeline.STANDARD,
+        )
+
+        tracker.register_job(job)
+        job.mark_running()
+        assert tracker.get_jobs_by_status(JobStatus.PENDING) == []
+        assert tracker.get_jobs_by_status(JobStatus.RUNNING) == [job]
+
+        job.mark_completed("Result")
+        stats = tracker.get_statistics()
+        assert stats["status_counts"]["running"] == 0
+        assert stats["status_counts"]["completed"] == 1
+
     def test_statistics(self):
         """Test statistics generation."""
         tracker = TaskTracker()
@@ -157,3 +264,328 @@ class TestTaskTracker:
 
         assert stats["total_jobs"] == 1
         assert "status_counts" in stats
+
+
+class TestTaskQueue:
+    """Test TaskQueue."""
+
+    @staticmethod
+    def _job(job_id: str) -> Job:
+        return Job(
+            job_id=job_id,
+            source_path="document.pdf",
+            pipeline=ProcessingPipeline.STANDARD,
+        )
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        """Test jobs are dequeued in FIFO order and the queue is bounded."""
+        queue = TaskQueue(max_size=2)
+
+        assert await queue.enqueue(self._job("first"))
+        assert await queue.enqueue(self._job("second"))
+        assert not await queue.enqueue(self._job("overflow"))
+        assert queue.get_stats()["is_full"]
+
+        order = [(await queue.dequeue()).job_id for _ in range(2)]
+        assert order == ["first", "second"]
+        assert await queue.dequeue(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_enqueue_blocking_waits_for_slot(self):
+        """Test blocking enqueue waits for a dequeue or times out."""
+        queue = TaskQueue(max_size=1)
+        await queue.enqueue(self._job("first"))
+
+        assert not await queue.enqueue_blocking(self._job("late"), timeout=0.01)
+
+        producer = asyncio.create_task(queue.enqueue_blocking(self._job("second")))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        assert (await queue.dequeue()).job_id == "first"
+        assert await producer
+        assert (await queue.dequeue()).job_id == "second"
+
+
+class TestJobScheduler:
+    """Test JobScheduler."""
+
+    @staticmethod
+    def _job(job_id: str, priority: int = 5) -> Job:
+        return Job(
+            job_id=job_id,
+            source_path="document.pdf",
+            pipeline=ProcessingPipeline.STANDARD,
+            priority=priority,
+        )
+
+    @staticmethod
+    async def _admit_all(scheduler, jobs):
+        """Queue jobs behind a held slot and return their admission order."""
+        order = []
+
+        async def run(job):
+            await scheduler.acquire(job)
+            order.append(job.job_id)
+
+        await scheduler.acquire(TestJobScheduler._job("holder"))
+        tasks = []
+        for job in jobs:
+            tasks.append(asyncio.create_task(run(job)))
+            await asyncio.sleep(0)
+
+        for _ in jobs:
+            scheduler.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return order
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test lower priority values are admitted first, FIFO within a level."""
+        scheduler = JobScheduler(max_running=1)
+        order = await self._admit_all(
+            scheduler,
+            [self._job("low", 9), self._job("first"), self._job("second")],
+        )
+        assert order == ["first", "second", "low"]
+
+    @pytest.mark.asyncio
+    async def test_aging_promotes_waiting_jobs(self):
+        """Test long-waiting jobs overtake newer higher-priority jobs."""
+        scheduler = JobScheduler(max_running=1, aging_interval=0.01)
+        await scheduler.acquire(self._job("holder"))
+
+        old = asyncio.create_task(scheduler.acquire(self._job("old", 7)))
+        await asyncio.sleep(0.05)
+        new = asyncio.create_task(scheduler.acquire(self._job("new", 5)))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await asyncio.sleep(0)
+        assert old.done() and not new.done()
+
+        scheduler.release()
+        await new
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_groups(self):
+        """Test groups share freed slots in proportion to their weights."""
+        scheduler = JobScheduler(max_running=1)
+        await scheduler.acquire(self._job("holder"))
+        order = []
+
+        async def run(job_id, group_key, weight):
+            await scheduler.acquire(self._job(job_id), group_key, weight)
+            order.append(group_key)
+
+        tasks = []
+        for i in range(6):
+            tasks.append(asyncio.create_task(run(f"b{i}", "b", 1)))
+            await asyncio.sleep(0)
+        for i in range(6):
+            tasks.append(asyncio.create_task(run(f"a{i}", "a", 3)))
+            await asyncio.sleep(0)
+
+        for _ in range(8):
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        assert order == ["b", "a", "a", "a", "b", "a", "a", "a"]
+
+        for _ in range(4):
+            scheduler.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        """Test a cancelled waiter doesn't take or leak a slot."""
+        scheduler = JobScheduler(max_running=1)
+        await scheduler.acquire(self._job("holder"))
+
+        cancelled = asyncio.create_task(scheduler.acquire(self._job("a", 0)))
+        waiting = asyncio.create_task(scheduler.acquire(self._job("b")))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await waiting
+        scheduler.release()
+
+        # Nothing is running or waiting, so the next job starts right away
+        await asyncio.wait_for(scheduler.acquire(self._job("c")), 0.1)
+
+
+class TestResultPaging:
+    """Test paged results."""
+
+    def test_spool_markdown_pages(self, tmp_path):
+        """Test pages split on characters and read back in any order."""
+        markdown = "é" * 5 + "abc"
+        result = spool_markdown(markdown, str(tmp_path / "spool"), page_chars=3)
+
+        assert result.page_count == 3
+        assert result.chars == 8
+        assert result.read_page(2) == "bc"
+        assert "".join(result.read_page(p) for p in range(3)) == markdown
+
+        with pytest.raises(ValueError):
+            result.read_page(3)
+
+        result.discard()
+        assert not list((tmp_path / "spool").iterdir())
+
+    @pytest.mark.asyncio
+    async def test_handlers_serve_pages(self, tmp_path):
+        """Test parse_document returns the first page and later pages on request."""
+        markdown = "x" * 5 + "y" * 5 + "z" * 2
+        spooled = spool_markdown(markdown, str(tmp_path), page_chars=5)
+
+        class FakeProcessor:
+            async def process_document_paged(self, source, pipeline, options):
+                return spooled
+
+        handlers = ToolHandlers(ApplicationSettings(), FakeProcessor(), TaskTracker())
+
+        first, paging = await handlers.handle_parse_document({"source": "doc.pdf"})
+        info = json.loads(paging.text)
+        assert first.text == "xxxxx"
+        assert info["page"] == 0 and info["total_pages"] == 3
+
+        job_id = info["job_id"]
+        pages = [first.text]
+        for page in (1, 2):
+            content = await handlers.handle_get_result_page(
+                {"job_id": job_id, "page": page}
+            )
+            pages.append(content[0].text)
+
+        assert "".join(pages) == markdown
+        assert not list(tmp_path.iterdir())
+
+        with pytest.raises(ValueError):
+            await handlers.handle_get_result_page({"job_id": job_id, "page": 0})
+
+
+class TestPipelineFactory:
+    """Test PipelineFactory."""
+
+    def test_pipeline_options_are_cached(self, monkeypatch):
+        """Test pipeline options are reused for identical requests."""
+        factory = PipelineFactory(ProcessingSettings())
+        calls = []
+
+        def fake_create(pipeline, user_options):
+            calls.append(pipeline)
+            return {"pipeline": pipeline}
+
+        monkeypatch.setattr(factory, "_create_pipeline_options", fake_create)
+
+        first = factory.create_pipeline_options(
+            ProcessingPipeline.STANDARD, {"ocr_enabled": True}
+        )
+        second = factory.create_pipeline_options(
+            ProcessingPipeline.STANDARD, {"ocr_enabled": True}
+        )
+        assert first is second
+        assert len(calls) == 1
+
+        # Option sets that build the same options share an entry
+        factory.create_pipeline_options(ProcessingPipeline.STANDARD, {})
+        factory.create_pipeline_options(
+            ProcessingPipeline.STANDARD,
+            {"pdf_backend": "dlparse_v4", "asr_model": "whisper_large"},
+        )
+        assert len(calls) == 1
+
+        # Replacing settings invalidates the cache
+        factory.settings = ProcessingSettings()
+        factory.create_pipeline_options(
+            ProcessingPipeline.STANDARD, {"ocr_enabled": True}
+        )
+        assert len(calls) == 2
+
+    def test_invalid_user_options_are_rejected(self):
+        """Test unknown option values are rejected instead of cached."""
+        factory = PipelineFactory(ProcessingSettings())
+
+        for options in (
+            {"table_accuracy_mode": "fastest"},
+            {"pdf_backend": "other"},
+            {"ocr_enabled": "yes"},
+            {"enable_enrichments": ["x"]},
+        ):
+            with pytest.raises(ValueError):
+                factory.create_pipeline_options(ProcessingPipeline.STANDARD, options)
+
+    def test_converter_cache_is_bounded(self, monkeypatch):
+        """Test converters are kept in a small LRU cache."""
+        module = types.ModuleType("docling.document_converter")
+        module.DocumentConverter = lambda format_options: object()
+        monkeypatch.setitem(sys.modules, "docling.document_converter", module)
+
+        cache = ConverterCache(ProcessingSettings(), max_size=2)
+        monkeypatch.setattr(
+            cache.pipeline_factory,
+            "create_pipeline_options",
+            lambda pipeline, options: {},
+        )
+
+        fast = cache.get(ProcessingPipeline.STANDARD, {"table_accuracy_mode": "fast"})
+        cache.get(ProcessingPipeline.VLM, {})
+        assert (
+            cache.get(ProcessingPipeline.STANDARD, {"table_accuracy_mode": "fast"})
+            is fast
+        )
+
+        # VLM is now least recently used and gets evicted
+        cache.get(ProcessingPipeline.ASR, {})
+        assert len(cache._converters) == 2
+        assert (
+            cache.get(ProcessingPipeline.STANDARD, {"table_accuracy_mode": "fast"})
+            is fast
+        )
+
+    def test_pdf_backend_is_applied(self, monkeypatch):
+        """Test the configured and fallback PDF backends reach Docling."""
+        from document_parser.engine import pipeline_factory
+
+        class FakeFormatOption:
+            def __init__(self, pipeline_options=None, backend=None):
+                self.pipeline_options = pipeline_options
+                self.backend = backend
+
+        class FakePipelineOptions:
+            def __init__(self):
+                self.table_structure_options = types.SimpleNamespace(mode=None)
+
+        monkeypatch.setattr(
+            pipeline_factory,
+            "_import_standard_pipeline",
+            lambda: (
+                types.SimpleNamespace(PDF="pdf"),
+                FakePipelineOptions,
+                FakeFormatOption,
+                types.SimpleNamespace(FAST="fast", ACCURATE="accurate"),
+            ),
+        )
+        backends = {}
+        for name, (module_name, class_name) in pipeline_factory._PDF_BACKENDS.items():
+            module = types.ModuleType(module_name)
+            backends[name] = type(class_name, (), {})
+            setattr(module, class_name, backends[name])
+            monkeypatch.setitem(sys.modules, module_name, module)
+
+        factory = PipelineFactory(ProcessingSettings())
+        monkeypatch.setattr(PipelineFactory, "accelerator_options", None)
+
+        default = factory.create_pipeline_options(ProcessingPipeline.STANDARD, {})
+        fallback = factory.create_pipeline_options(
+            ProcessingPipeline.STANDARD, {"pdf_backend": "pypdfium2"}
+        )
+
+        assert default["pdf"].backend is backends["dlparse_v4"]
+        assert fallback["pdf"].backend is backends["pypdfium2"]
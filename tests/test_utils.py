@@ -2,17 +2,28 @@
 Tests for utility functions.
 """
 
+import base64
+import logging
+import os
+import time
+
+import pytest
+
 from document_parser.utils.file_utils import (
+    cleanup_old_files,
+    cleanup_old_files_async,
     detect_document_type,
     get_file_extension,
     sanitize_filename,
+    sanitize_filenames,
 )
+from document_parser.utils.logging_utils import get_worker_log_queue, stop_logging
 from document_parser.utils.network_utils import (
     extract_filename_from_url,
     is_valid_url,
     validate_url_scheme,
 )
-from document_parser.utils.system_utils import generate_unique_id
+from document_parser.utils.system_utils import _ID_SEQUENCE_MASK, generate_unique_id
 
 
 class TestFileUtils:
@@ -24,6 +35,24 @@ class TestFileUtils:
         assert sanitize_filename("file:name.pdf") == "file_name.pdf"
         assert sanitize_filename("file<>name.pdf") == "file__name.pdf"
         assert sanitize_filename('file"name.pdf') == "file_name.pdf"
+        assert sanitize_filename("file\0name.pdf") == "file_name.pdf"
+
+    def test_sanitize_filenames(self):
+        """Test batch sanitization, including non-ASCII names."""
+        names = ["a:b.pdf", "résumé?.docx", "ok.txt", "bad\ud800:.md"]
+        assert sanitize_filenames(names) == [
+            "a_b.pdf",
+            "résumé_.docx",
+            "ok.txt",
+            "bad\ud800_.md",
+        ]
+
+        # Names containing the batch separator, long names and empty batches
+        long_name = "x" * 300 + ":.pdf"
+        names = ["a\nb:c.txt", long_name]
+        assert sanitize_filenames(names) == [sanitize_filename(n) for n in names]
+        assert len(sanitize_filenames(["ok", long_name])[1]) == 200
+        assert sanitize_filenames([]) == []
 
     def test_get_file_extension(self):
         """Test file extension extraction."""
@@ -53,6 +82,82 @@ class TestFileUtils:
         assert doc_type == "audio"
         assert pipeline == "asr"
 
+    def test_detect_document_type_mapping(self):
+        """Test extension lookup for other types, URLs and mixed case."""
+        assert detect_document_type("report.DOCX") == ("office_document", "standard")
+        assert detect_document_type("page.htm") == ("web_document", "standard")
+        assert detect_document_type("scan.JPEG") == ("image", "vlm")
+        assert detect_document_type("https://example.com/a/talk.wav?x=1") == (
+            "audio",
+            "asr",
+        )
+
+    def test_detect_document_type_from_header(self, tmp_path):
+        """Test detection falls back to the file header for unknown extensions."""
+        pdf = tmp_path / "download.bin"
+        pdf.write_bytes(b"%PDF-1.7\n")
+        assert detect_document_type(str(pdf)) == ("pdf", "standard")
+
+        wav = tmp_path / "recording"
+        wav.write_bytes(b"RIFF\x24\x00\x00\x00WAVEfmt ")
+        assert detect_document_type(str(wav)) == ("audio", "asr")
+
+        other = tmp_path / "notes.bin"
+        other.write_bytes(b"plain text")
+        assert detect_document_type(str(other)) == ("unknown", "standard")
+
+    def test_cleanup_old_files(self, tmp_path):
+        """Test only stale files and empty directories are removed."""
+        stale = tmp_path / "stale.pdf"
+        stale.write_text("old")
+        two_days_ago = time.time() - 48 * 3600
+        os.utime(stale, (two_days_ago, two_days_ago))
+
+        fresh = tmp_path / "fresh.pdf"
+        fresh.write_text("new")
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "full").mkdir()
+        (tmp_path / "full" / "keep.txt").write_text("x")
+
+        assert cleanup_old_files(str(tmp_path), max_age_hours=24) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh.pdf", "full"]
+        assert cleanup_old_files(str(tmp_path / "missing")) == 0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_old_files_async(self, tmp_path):
+        """Test async cleanup removes stale files."""
+        stale = tmp_path / "stale.pdf"
+        stale.write_text("old")
+        two_days_ago = time.time() - 48 * 3600
+        os.utime(stale, (two_days_ago, two_days_ago))
+
+        assert await cleanup_old_files_async(str(tmp_path), max_age_hours=24) == 1
+        assert not stale.exists()
+
+
+class TestLoggingUtils:
+    """Test logging utility functions."""
+
+    def test_worker_log_records_are_forwarded(self, caplog):
+        """Test records queued by a worker reach the parent's handlers."""
+        log_queue = get_worker_log_queue()
+        assert get_worker_log_queue() is log_queue
+
+        record = logging.LogRecord(
+            "document_parser.worker",
+            logging.WARNING,
+            __file__,
+            1,
+            "from worker",
+            None,
+            None,
+        )
+        with caplog.at_level(logging.WARNING):
+            log_queue.put(record)
+            stop_logging()
+
+        assert [r.getMessage() for r in caplog.records] == ["from worker"]
+
 
 class TestNetworkUtils:
     """Test network utility functions."""
@@ -64,6 +169,12 @@ class TestNetworkUtils:
         assert is_valid_url("ftp://ftp.example.com") is True
         assert is_valid_url("/local/path/file.pdf") is False
         assert is_valid_url("not a url") is False
+        assert is_valid_url("://example.com") is False
+        assert is_valid_url("./http://example.com") is False
+        assert is_valid_url("git+ssh://example.com/repo") is True
+        assert is_valid_url("C:/docs/http://example.com") is False
+        assert is_valid_url(["https://example.com"]) is False
+        assert is_valid_url(None) is False
 
     def test_extract_filename_from_url(self):
         """Test filename extraction from URL."""
@@ -73,6 +184,10 @@ class TestNetworkUtils:
         url = "https://example.com/"
         assert extract_filename_from_url(url) is None
 
+        url = "https://example.com/docs/report.pdf?next=/a/b.html#top"
+        assert extract_filename_from_url(url) == "report.pdf"
+        assert extract_filename_from_url("https://example.com") is None
+
     def test_validate_url_scheme(self):
         """Test URL scheme validation."""
         allowed = ["http", "https"]
@@ -93,9 +208,58 @@ class TestSystemUtils:
         assert id1 != id2
         assert len(id1) == 8
 
+    def test_generate_unique_id_blocks(self):
+        """Test IDs stay unique across blocks and each block has a new prefix."""
+        ids = [generate_unique_id() for _ in range(600)]
+        assert len(set(ids)) == len(ids)
+        assert all(len(i) == 8 for i in ids)
+
+        prefixes = {
+            int.from_bytes(base64.b32decode(i.upper()), "big") >> 8 for i in ids
+        }
+        assert len(prefixes) >= 3
+
     def test_generate_unique_id_with_prefix(self):
         """Test unique ID generation with prefix."""
         job_id = generate_unique_id("job")
 
         assert job_id.startswith("job_")
         assert len(job_id) > 4
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_generate_unique_id_after_fork(self, monkeypatch):
+        """Test a forked child does not continue the parent's ID stream."""
+        from document_parser.utils import system_utils
+
+        def decode(unique_id):
+            return int.from_bytes(base64.b32decode(unique_id.upper()), "big")
+
+        parent_ids = [generate_unique_id() for _ in range(3)]
+
+        # Make the child's first draw repeat the parent's prefix
+        draws = [decode(parent_ids[-1]) >> 8]
+        real_randbits = system_utils.secrets.randbits
+        monkeypatch.setattr(
+            system_utils.secrets,
+            "randbits",
+            lambda k: draws.pop() if draws else real_randbits(k),
+        )
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            child_ids = [generate_unique_id() for _ in range(3)]
+            os.write(write_fd, ",".join(child_ids).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as f:
+            child_ids = f.read().split(",")
+
+        # The child starts a new block with a prefix the parent isn't using
+        parent_ids.append(generate_unique_id())
+        assert len(parent_ids) == len(set(parent_ids))
+        assert decode(child_ids[0]) & _ID_SEQUENCE_MASK == 0
+        assert decode(child_ids[0]) >> 8 != decode(parent_ids[-1]) >> 8
+        assert not set(child_ids) & set(parent_ids)